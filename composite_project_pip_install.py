@@ -46,7 +46,7 @@ import os
 from packaging import version
 from pathlib import Path
 import re
-import requests
+import shutil
 import subprocess
 from typing import List, Optional, Dict, Union, Tuple
 
@@ -134,7 +134,7 @@ class SubprojectInfo:
     name: str
     github_url: Optional[str] = None
     last_commit_date: Optional[datetime] = None
-    requirements: Dict[str, Package] = None
+    requirements: Dict[str, Package] = field(default_factory=dict)
     depth: int = 0  # Depth from root
     parent_path: Optional[Path] = None  # Path to parent project if nested
     is_nested: bool = False  # Whether this is a nested requirements file
@@ -201,14 +201,14 @@ class SubprojectFinder:
             max_depth: Maximum depth to search for requirements files (default: 2)
         """
         subprojects = []
-        processed_paths = set()  # Track paths we've already processed
+        processed_paths: set = set()  # Directory strings we've already processed
         
         # First, find all Git repositories
         for git_dir in root_path.rglob('.git'):
             if git_dir.is_dir():
                 subproject_path = git_dir.parent
-                if subproject_path not in processed_paths:
-                    processed_paths.add(subproject_path)
+                if str(subproject_path) not in processed_paths:
+                    processed_paths.add(str(subproject_path))
                     
                     # Look for requirements.txt in this directory
                     req_file = subproject_path / 'requirements.txt'
@@ -224,9 +224,11 @@ class SubprojectFinder:
         
         # Then, find all requirements.txt files that weren't already processed
         for req_file in root_path.rglob('requirements.txt'):
-            subproject_path = req_file.parent
-            if subproject_path not in processed_paths:
-                processed_paths.add(subproject_path)
+            # Compare directory strings first; only build a Path for new directories
+            parent_dir = os.path.dirname(req_file)
+            if parent_dir not in processed_paths:
+                processed_paths.add(parent_dir)
+                subproject_path = req_file.parent
                 
                 subproject = SubprojectFinder._create_subproject(
                     subproject_path,
@@ -244,16 +246,16 @@ class SubprojectFinder:
     def _parse_requirements(req_file: Path) -> Dict[str, Package]:
         """Parse requirements.txt file into package-version dictionary."""
         requirements = {}
-        with open(req_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    try:
-                        package = Package.from_string(line)
-                        requirements[package.name] = package
-                    except Exception as e:
-                        print(f"Error parsing line: {line}")
-                        print(f"Error: {e}")
+        text = req_file.read_text(encoding='utf-8', errors='replace')
+        for raw in text.splitlines():
+            line = raw.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                package = Package.from_string(line)
+                requirements[package.name] = package
+            except Exception as e:
+                logger.warning("Error parsing line %r: %s", line, e)
         return requirements
 
 class VersionComparator:
@@ -637,12 +639,9 @@ class GitManager:
                 logger.warning(f"Failed to get tracked files: {tracked_result.stderr}")
                 return
                 
-            # Create set of tracked files with both path separator variants
-            tracked_files = set()
-            for file in tracked_result.stdout.strip().split('\n'):
-                if file:
-                    tracked_files.add(file)
-                    tracked_files.add(file.replace('/', '\\'))
+            # Normalize tracked paths once to the platform separator used by relative_to()
+            sep = os.sep
+            tracked_files = {f.replace('/', sep) for f in tracked_result.stdout.splitlines() if f}
             
             # Additionally, explicitly clean common Python artifacts that might not be in .gitignore
             for pattern in self.PYTHON_IGNORE_PATTERNS:
@@ -655,14 +654,12 @@ class GitManager:
                             has_tracked_files = False
                             for file_path in dir_path.rglob('*'):
                                 if file_path.is_file():
-                                    rel_path = str(file_path.relative_to(path))
-                                    if rel_path in tracked_files or rel_path.replace('\\', '/') in tracked_files:
+                                    if str(file_path.relative_to(path)) in tracked_files:
                                         has_tracked_files = True
                                         break
                                         
                             if not has_tracked_files:
                                 try:
-                                    import shutil
                                     shutil.rmtree(dir_path)
                                     logger.info(f"Removed directory: {dir_path}")
                                 except Exception as e:
@@ -671,8 +668,7 @@ class GitManager:
                 else:
                     for file_path in path.rglob(pattern):
                         if file_path.is_file():
-                            rel_path = str(file_path.relative_to(path))
-                            if rel_path not in tracked_files and rel_path.replace('\\', '/') not in tracked_files:
+                            if str(file_path.relative_to(path)) not in tracked_files:
                                 try:
                                     file_path.unlink()
                                     logger.info(f"Removed file: {file_path}")
@@ -820,6 +816,14 @@ class PipInstaller:
     
     def __init__(self, test_mode: TestModeManager):
         self.test_mode = test_mode
+        self._pip_paths: Dict[Path, str] = {}
+    
+    def _pip_path(self, env_path: Path) -> str:
+        """Return path to pip executable for the given environment, computed once per env."""
+        pip = self._pip_paths.get(env_path)
+        if pip is None:
+            pip = self._pip_paths[env_path] = str(env_path / 'Scripts' / 'pip' if os.name == 'nt' else env_path / 'bin' / 'pip')
+        return pip
     
     def install_requirements(self, requirements_file: Path, env_path: Path) -> Tuple[bool, Optional[str]]:
         """Install packages from a requirements.txt file.
@@ -829,7 +833,7 @@ class PipInstaller:
             success is True if the packages were installed or already satisfied
             error_message is None if successful, or contains the error message if failed
         """
-        pip_cmd = [str(env_path / 'Scripts' / 'pip' if os.name == 'nt' else env_path / 'bin' / 'pip'), 'install', '-r', str(requirements_file)]
+        pip_cmd = [self._pip_path(env_path), 'install', '-r', str(requirements_file)]
             
         if self.test_mode.enabled:
             self.test_mode.log_operation(
@@ -875,7 +879,7 @@ class PipInstaller:
             success is True if the package was installed or already satisfied
             error_message is None if successful, or contains the error message if failed
         """
-        pip_cmd = [str(env_path / 'Scripts' / 'pip' if os.name == 'nt' else env_path / 'bin' / 'pip'), 'install', f"{package}=={version}" if version else package]
+        pip_cmd = [self._pip_path(env_path), 'install', f"{package}=={version}" if version else package]
             
         if self.test_mode.enabled:
             self.test_mode.log_operation(
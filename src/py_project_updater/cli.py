@@ -1,6 +1,8 @@
 """CLI for py_project_updater: argparse and main entrypoint."""
 
 import argparse
+import hashlib
+import json
 import logging
 import os
 import subprocess
@@ -12,6 +14,7 @@ from py_project_updater.config import (
     DEFAULT_IGNORE,
     DEFAULT_LOG_LEVEL,
     DEFAULT_MAX_DEPTH,
+    default_cache_dir,
     default_log_file_for_root,
 )
 from py_project_updater.orchestration import SubprojectManager
@@ -37,6 +40,7 @@ Required:
 Optional:
     --execute          Actually make changes (default: test mode)
     --git-only         Only perform Git operations, skip pip
+    --batch-pip        Install all subprojects' requirements with one pip call
     --max-depth N      Max depth to search for requirements (default: 3)
     --ignore NAME      Subproject names to ignore (repeatable)
     --log-level LEVEL  DEBUG|INFO|WARNING|ERROR|CRITICAL
@@ -57,6 +61,7 @@ def main() -> None:
     logger.info("Using environment: %s", args.env_path)
     logger.info("Mode: %s", "EXECUTE" if args.execute else "TEST (no changes)")
     logger.info("Git only: %s", "enabled" if args.git_only else "disabled")
+    logger.info("Batch pip: %s", "enabled" if args.batch_pip else "disabled")
     logger.info("Max depth: %s", args.max_depth)
     logger.info("Log file: %s", log_file)
     if args.ignore:
@@ -69,6 +74,7 @@ def main() -> None:
             test_mode=not args.execute,
             git_only=args.git_only,
             max_depth=args.max_depth,
+            batch_pip=args.batch_pip,
         )
         manager.set_ignored_subprojects(args.ignore)
         manager.run()
@@ -104,6 +110,11 @@ def _make_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Only perform Git operations, skip pip installations",
     )
+    p.add_argument(
+        "--batch-pip",
+        action="store_true",
+        help="Install all subprojects' requirements with a single pip invocation",
+    )
     p.add_argument(
         "--max-depth",
         type=int,
@@ -144,6 +155,18 @@ def _validate_env(env_path: Path) -> None:
     if not python_exe.exists():
         raise ValueError(f"Python executable not found in environment: {python_exe}")
 
+    # The version check forks the env's interpreter; skip it while the
+    # interpreter is the one verified last time.
+    stamp = [python_exe.stat().st_mtime_ns, python_exe.lstat().st_mtime_ns]
+    marker = _env_marker_file(env_path)
+    try:
+        cached = json.loads(marker.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = None
+    if isinstance(cached, dict) and cached.get("stamp") == stamp:
+        logger.info("Using Python: %s", cached.get("version", ""))
+        return
+
     try:
         result = subprocess.run(
             [str(python_exe), "--version"],
@@ -152,12 +175,24 @@ def _validate_env(env_path: Path) -> None:
         )
         if result.returncode != 0:
             raise ValueError(f"Failed to get Python version: {result.stderr}")
-        logger.info("Using Python: %s", result.stdout.strip())
+        version = result.stdout.strip()
+        logger.info("Using Python: %s", version)
     except Exception as e:
         if isinstance(e, ValueError):
             raise
         raise ValueError(f"Failed to verify Python installation: {e!s}") from e
 
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_text(json.dumps({"stamp": stamp, "version": version}), encoding="utf-8")
+    except OSError as e:
+        logger.debug("Could not write env marker %s: %s", marker, e)
+
+
+def _env_marker_file(env_path: Path) -> Path:
+    key = hashlib.blake2b(str(env_path.resolve()).encode(), digest_size=16).hexdigest()
+    return default_cache_dir() / f"env-{key}.json"
+
 
 def _configure_logging(
     level: str = "INFO",
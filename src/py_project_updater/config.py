@@ -1,5 +1,6 @@
 """Defaults and config loading for py_project_updater."""
 
+import os
 from pathlib import Path
 from typing import List
 
@@ -20,3 +21,9 @@ DEFAULT_LOG_FILE_PREFIX = "py_project_updater"
 def default_log_file_for_root(root_path: Path) -> Path:
     """Return the default log file path for a given root directory."""
     return Path(f"{DEFAULT_LOG_FILE_PREFIX}_{root_path.name}.log")
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "py-project-updater"
@@ -1,12 +1,13 @@
 """Data structures for py_project_updater."""
 
 from py_project_updater.models.package import Package
-from py_project_updater.models.subproject import OperationResult, SubprojectInfo
+from py_project_updater.models.subproject import OperationResult, OpKind, SubprojectInfo
 from py_project_updater.models.version import Version, VersionSpecifier
 
 __all__ = [
     "Package",
     "OperationResult",
+    "OpKind",
     "SubprojectInfo",
     "Version",
     "VersionSpecifier",
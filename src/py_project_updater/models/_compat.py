@@ -0,0 +1,7 @@
+"""Small compatibility shims for the models package."""
+
+import sys
+from typing import Any, Dict
+
+# dataclass(slots=True) needs Python 3.10; older versions get regular classes.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -1,41 +1,84 @@
 """Package model for requirements."""
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional
 
+from packaging.requirements import InvalidRequirement, Requirement
+
+from py_project_updater.models._compat import DATACLASS_SLOTS
 from py_project_updater.models.version import Version, VersionSpecifier
 
+# Two-character operators come first so ">=" wins over ">" at the same position.
+_SPEC_RE = re.compile(r"(==|>=|<=|~=|!=|>|<)")
+_OP_TO_SPEC: Dict[str, VersionSpecifier] = {s.value: s for s in VersionSpecifier}
+# The common "name" / "name<op>version" line, parsed without building a Requirement.
+_SIMPLE_REQ_RE = re.compile(
+    r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:(==|>=|<=|~=|!=|>|<)\s*([A-Za-z0-9.*+!_-]+))?\s*"
+)
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Package:
-    """Represents a Python package with its version requirements."""
+    """Represents a Python package with its version requirements.
+
+    version holds the single clause used for comparisons. When the line says
+    more than name + version (several specifiers, a marker, a direct URL),
+    requirement keeps the full PEP 508 form and is what str() returns, so pip
+    still receives the complete spec.
+    """
 
     name: str
     version: Optional[Version] = None
+    requirement: Optional[str] = None
 
     @classmethod
     def from_string(cls, package_str: str) -> "Package":
-        """Create a Package instance from a requirements.txt line."""
-        if (
-            "==" not in package_str
-            and ">=" not in package_str
-            and "<=" not in package_str
-            and ">" not in package_str
-            and "<" not in package_str
-            and "~=" not in package_str
-            and "!=" not in package_str
-        ):
-            return cls(name=package_str.strip())
+        """Create a Package instance from a requirements.txt line.
+
+        Lines are parsed as PEP 508 requirements. Extras stay part of the name
+        (e.g. "foo[ssl]"); environment markers, URL requirements and multiple
+        specifiers are kept in requirement. Lines packaging rejects (trailing
+        comments, pip options) fall back to splitting on the first version
+        operator.
+        """
+        m = _SIMPLE_REQ_RE.fullmatch(package_str)
+        if m is not None:
+            name, op, ver = m.groups()
+            if op is None:
+                return cls(name=name)
+            return cls(name=name, version=Version(specifier=_OP_TO_SPEC[op], version=ver))
 
-        specifiers = [s for s in VersionSpecifier if s.value in package_str]
-        if not specifiers:
+        try:
+            req = Requirement(package_str)
+        except InvalidRequirement:
+            return cls._from_string_fallback(package_str)
+        return cls._from_requirement(req)
+
+    @classmethod
+    def _from_requirement(cls, req: Requirement) -> "Package":
+        name = req.name
+        if req.extras:
+            name += "[" + ",".join(sorted(req.extras)) + "]"
+        package = cls(name=name, version=Version.from_specifier_set(req.specifier))
+        full = str(req)
+        if full != str(package):
+            package.requirement = full
+        return package
+
+    @classmethod
+    def _from_string_fallback(cls, package_str: str) -> "Package":
+        m = _SPEC_RE.search(package_str)
+        if m is None:
             return cls(name=package_str.strip())
 
-        specifier = specifiers[0]
-        name, ver = package_str.split(specifier.value, 1)
-        return cls(name=name.strip(), version=Version(specifier=specifier, version=ver.strip()))
+        name = package_str[: m.start()].strip()
+        ver = package_str[m.end() :].strip()
+        return cls(name=name, version=Version(specifier=_OP_TO_SPEC[m.group(1)], version=ver))
 
     def __str__(self) -> str:
+        if self.requirement is not None:
+            return self.requirement
         if self.version:
             return f"{self.name}{self.version}"
         return self.name
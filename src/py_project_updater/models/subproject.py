@@ -2,13 +2,15 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntFlag
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from py_project_updater.models._compat import DATACLASS_SLOTS
 from py_project_updater.models.package import Package
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SubprojectInfo:
     """Represents information about a subproject."""
 
@@ -24,7 +26,18 @@ class SubprojectInfo:
     error: Optional[str] = None
 
 
-@dataclass
+class OpKind(IntFlag):
+    """Keywords found in an operation message, classified once when logged."""
+
+    NONE = 0
+    INSTALL = 1
+    WARNING = 2
+    PULL = 4
+    FETCH = 8
+    STATUS = 16
+
+
+@dataclass(**DATACLASS_SLOTS)
 class OperationResult:
     """Represents the result of an operation in test mode."""
 
@@ -33,3 +46,6 @@ class OperationResult:
     command: Optional[str] = None
     changes: List[str] = field(default_factory=list)
     project_name: Optional[str] = None
+    kind: OpKind = OpKind.NONE
+    package_name: Optional[str] = None
+    package_version: Optional[str] = None
@@ -1,8 +1,15 @@
 """Version specifier and Version model for package requirements."""
 
-from dataclasses import dataclass
+import functools
+import operator
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import Callable, Dict, Optional
+
 from packaging import version as pkg_version
+from packaging.specifiers import SpecifierSet
+
+from py_project_updater.models._compat import DATACLASS_SLOTS
 
 
 class VersionSpecifier(Enum):
@@ -17,37 +24,98 @@ class VersionSpecifier(Enum):
     NOT_EQUAL = "!="
 
 
-@dataclass
+# When a requirement carries several specifiers, the one that best identifies
+# the version to install is kept (exact pins first, exclusions last).
+_SPECIFIER_PREFERENCE = (
+    VersionSpecifier.EXACT,
+    VersionSpecifier.COMPATIBLE,
+    VersionSpecifier.GREATER_EQUAL,
+    VersionSpecifier.GREATER,
+    VersionSpecifier.LESS_EQUAL,
+    VersionSpecifier.LESS,
+    VersionSpecifier.NOT_EQUAL,
+)
+
+# Comparators take (current, other) and report whether other satisfies current.
+# COMPATIBLE needs the cached upper bound and is handled in is_compatible_with.
+_CMP: Dict[VersionSpecifier, Callable[[pkg_version.Version, pkg_version.Version], bool]] = {
+    VersionSpecifier.EXACT: operator.eq,
+    VersionSpecifier.GREATER_EQUAL: lambda c, o: o >= c,
+    VersionSpecifier.LESS_EQUAL: lambda c, o: o <= c,
+    VersionSpecifier.GREATER: lambda c, o: o > c,
+    VersionSpecifier.LESS: lambda c, o: o < c,
+    VersionSpecifier.NOT_EQUAL: operator.ne,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(version: str) -> pkg_version.Version:
+    """Parse a version string once per run; raises InvalidVersion like parse()."""
+    return pkg_version.parse(version)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Version:
     """Represents a package version with its specifier."""
 
     specifier: VersionSpecifier
     version: str
+    _parsed: Optional[pkg_version.Version] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    _next_major: Optional[pkg_version.Version] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+    def __post_init__(self) -> None:
+        try:
+            self._parsed = _parse_cached(self.version)
+        except pkg_version.InvalidVersion:
+            return
+        if self.specifier == VersionSpecifier.COMPATIBLE:
+            self._next_major = pkg_version.Version(f"{self._parsed.major + 1}.0.0")
+
+    @classmethod
+    def from_specifier_set(cls, specifiers: SpecifierSet) -> Optional["Version"]:
+        """Build a Version from a packaging SpecifierSet, or None if it has no usable clause.
+
+        Only one clause is kept; see _SPECIFIER_PREFERENCE for which one wins.
+        Operators without a VersionSpecifier counterpart (e.g. "===") are ignored.
+        """
+        by_op: Dict[VersionSpecifier, str] = {}
+        for spec in specifiers:
+            try:
+                op = VersionSpecifier(spec.operator)
+            except ValueError:
+                continue
+            by_op.setdefault(op, spec.version)
+        for op in _SPECIFIER_PREFERENCE:
+            if op in by_op:
+                return cls(specifier=op, version=by_op[op])
+        return None
 
     def __str__(self) -> str:
         return f"{self.specifier.value}{self.version}"
 
+    @property
+    def is_valid(self) -> bool:
+        """True if the version string parsed as PEP 440."""
+        return self._parsed is not None
+
     def is_compatible_with(self, other_version: str) -> bool:
         """Check if this version specifier is compatible with another version."""
+        current = self._parsed
+        if current is None:
+            return False
         try:
-            current = pkg_version.parse(self.version)
-            other = pkg_version.parse(other_version)
-
-            if self.specifier == VersionSpecifier.EXACT:
-                return current == other
-            elif self.specifier == VersionSpecifier.GREATER_EQUAL:
-                return other >= current
-            elif self.specifier == VersionSpecifier.LESS_EQUAL:
-                return other <= current
-            elif self.specifier == VersionSpecifier.GREATER:
-                return other > current
-            elif self.specifier == VersionSpecifier.LESS:
-                return other < current
-            elif self.specifier == VersionSpecifier.COMPATIBLE:
-                next_major = pkg_version.Version(f"{current.major + 1}.0.0")
-                return other >= current and other < next_major
-            elif self.specifier == VersionSpecifier.NOT_EQUAL:
-                return other != current
+            other = _parse_cached(other_version)
         except pkg_version.InvalidVersion:
             return False
-        return False
+
+        if self.specifier == VersionSpecifier.COMPATIBLE:
+            next_major = self._next_major
+            if next_major is None:
+                return False
+            return current <= other < next_major
+        cmp = _CMP.get(self.specifier)
+        return cmp(current, other) if cmp is not None else False
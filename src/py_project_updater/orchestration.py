@@ -1,10 +1,13 @@
 """SubprojectManager: main orchestrator for subproject Git and pip operations."""
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
-from py_project_updater.models import SubprojectInfo
+from py_project_updater.models import Package, SubprojectInfo
 from py_project_updater.reporting import TestModeManager
 from py_project_updater.services.finder import SubprojectFinder
 from py_project_updater.services.github_commit import GitHubCommitChecker
@@ -13,6 +16,9 @@ from py_project_updater.services.pip_installer import PipInstaller
 
 logger = logging.getLogger(__name__)
 
+# Subproject work is mostly waiting on git/pip child processes.
+MAX_SUBPROJECT_WORKERS = max(1, (os.cpu_count() or 4) * 3 // 4)
+
 
 class SubprojectManager:
     """Main orchestrator for managing subproject installations."""
@@ -24,15 +30,22 @@ class SubprojectManager:
         test_mode: bool = False,
         git_only: bool = False,
         max_depth: int = 2,
+        batch_pip: bool = False,
     ):
         self.root_path = root_path
         self.env_path = env_path
         self.ignored_subprojects: set = set()
         self.test_mode = TestModeManager(enabled=test_mode, root_path=root_path)
         self.git_manager = GitManager(self.test_mode)
-        self.pip_installer = PipInstaller(self.test_mode)
+        self.pip_installer = PipInstaller(self.test_mode, env_path)
         self.git_only = git_only
         self.max_depth = max_depth
+        self.batch_pip = batch_pip
+        # Every subproject installs into the same env, so pip runs one at a time.
+        self._pip_lock = threading.Lock()
+        # With batch_pip, subprojects whose git step succeeded wait here for
+        # the single merged install at the end of the run.
+        self._pending_pip: List[SubprojectInfo] = []
 
     def set_ignored_subprojects(self, subproject_names: List[str]) -> None:
         """Set which subprojects to ignore."""
@@ -45,35 +58,92 @@ class SubprojectManager:
 
     def process_subprojects(self) -> None:
         """Discover and process all subprojects."""
-        subprojects = SubprojectFinder.find_subprojects(self.root_path, self.max_depth)
+        subprojects = SubprojectFinder.find_subprojects(
+            self.root_path, self.max_depth, self.ignored_subprojects
+        )
         self.test_mode.subprojects = subprojects
+        self._pending_pip = []
 
+        active: List[SubprojectInfo] = []
         for subproject in subprojects:
             if subproject.name in self.ignored_subprojects:
                 logger.info("Skipping ignored subproject: %s", subproject.name)
                 continue
-            try:
-                self.process_subproject(subproject)
-            except Exception as e:
-                logger.error("Error processing subproject %s: %s", subproject.name, e)
-                raise
+            if subproject.path is not None:
+                active.append(subproject)
+
+        # Read-only git queries are independent per repo, so run each as one batch.
+        paths = [s.path for s in active if s.path is not None]
+        is_repo = self.git_manager.is_git_repos(paths)
+        remote_urls = self.git_manager.get_remote_urls([p for p in paths if is_repo[p]])
+
+        for subproject, path in zip(active, paths):
+            github_url = remote_urls.get(path)
+            if github_url:
+                subproject.github_url = github_url
+
+        updated: List[SubprojectInfo] = []
+        if active:
+            workers = min(len(active), MAX_SUBPROJECT_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(self.process_subproject, subproject, is_repo[path]): subproject
+                    for subproject, path in zip(active, paths)
+                }
+                for future in as_completed(futures):
+                    subproject = futures[future]
+                    try:
+                        if future.result():
+                            updated.append(subproject)
+                    except Exception as e:
+                        logger.error("Error processing subproject %s: %s", subproject.name, e)
+                        raise
+
+        if self._pending_pip:
+            pending = {id(s) for s in self._pending_pip}
+            self._install_all_packages([s for s in active if id(s) in pending])
 
-    def process_subproject(self, subproject: SubprojectInfo) -> None:
-        """Process a single subproject: Git then pip (unless --git-only)."""
+        self._record_last_commit_dates(updated)
+
+    def _record_last_commit_dates(self, subprojects: List[SubprojectInfo]) -> None:
+        """Look up last commit dates for updated repositories in one batch."""
+        paths = [s.path for s in subprojects if s.path is not None]
+        last_commits = GitHubCommitChecker.get_last_commit_dates(paths)
+        for subproject in subprojects:
+            last_commit = last_commits.get(subproject.path) if subproject.path else None
+            if last_commit:
+                logger.info("Last commit date for %s: %s", subproject.name, last_commit)
+                subproject.last_commit_date = last_commit
+            else:
+                logger.info("Could not determine last commit date for %s", subproject.name)
+
+    def process_subproject(
+        self, subproject: SubprojectInfo, is_repo: Optional[bool] = None
+    ) -> bool:
+        """Process a single subproject: Git then pip (unless --git-only).
+
+        Args:
+            subproject: Subproject to process.
+            is_repo: Precomputed result of GitManager.is_git_repo, if known.
+
+        Returns:
+            True if the subproject's Git repository was updated successfully.
+        """
         if subproject.path is None:
-            return
+            return False
         logger.info("Processing subproject: %s", subproject.name)
+        git_updated = False
 
         try:
-            if self.git_manager.is_git_repo(subproject.path):
-                github_url = self.git_manager.get_remote_url(subproject.path)
-                if github_url:
-                    subproject.github_url = github_url
-                    logger.info("GitHub URL: %s", github_url)
-
-                is_clean, status_msg, was_cleaned_by_filtering = self.git_manager.get_git_status(
-                    subproject.path
-                )
+            if is_repo is None:
+                is_repo = self.git_manager.is_git_repo(subproject.path)
+            if is_repo:
+                if subproject.github_url is None:
+                    subproject.github_url = self.git_manager.get_remote_url(subproject.path)
+                if subproject.github_url:
+                    logger.info("GitHub URL: %s", subproject.github_url)
+
+                status_msg = self.git_manager.get_git_status(subproject.path).message
                 logger.info("Git status: %s", status_msg)
                 self.test_mode.log_operation(
                     True,
@@ -90,7 +160,7 @@ class SubprojectManager:
                         project_name=subproject.name,
                     )
                     subproject.error = f"Git update failed: {message}"
-                    return
+                    return False
                 if "up to date" not in message.lower():
                     logger.info("%s", message)
                     self.test_mode.log_operation(True, message, project_name=subproject.name)
@@ -98,48 +168,126 @@ class SubprojectManager:
                     self.test_mode.log_operation(
                         True, "Repository up to date", project_name=subproject.name
                     )
-
-                last_commit = GitHubCommitChecker.get_last_commit_date(subproject.path)
-                if last_commit:
-                    logger.info("Last commit date: %s", last_commit)
-                    subproject.last_commit_date = last_commit
-                else:
-                    logger.info("Could not determine last commit date for %s", subproject.name)
+                git_updated = True
 
             if self.git_only:
                 logger.info("Skipping pip installations (--git-only mode)")
-                return
+                return git_updated
 
-            failed_packages: List[str] = []
+            if self.batch_pip:
+                self._pending_pip.append(subproject)
+            else:
+                self._install_packages(subproject)
 
-            for package_name, package in subproject.requirements.items():
-                version_str = str(package.version) if package.version else None
-                success, error = self.pip_installer.install_package(
-                    package_name, version_str, self.env_path
-                )
-                if success:
-                    logger.info("Installed %s", package)
-                    self.test_mode.log_operation(
-                        True, f"Installed {package}", project_name=subproject.name
-                    )
-                else:
-                    logger.warning("Failed to install %s: %s", package, error)
-                    self.test_mode.log_operation(
-                        False,
-                        f"Failed to install {package}: {error}",
-                        project_name=subproject.name,
+        except Exception as e:
+            self._record_failure(subproject, e)
+        return git_updated
+
+    def _record_failure(self, subproject: SubprojectInfo, e: Exception) -> None:
+        error_msg = f"Error processing subproject: {e!s}"
+        logger.error("%s", error_msg)
+        subproject.error = error_msg
+        self.test_mode.log_operation(False, error_msg, project_name=subproject.name)
+
+    def _log_installed(self, subproject: SubprojectInfo, packages: List[Package]) -> None:
+        for package in packages:
+            self.test_mode.log_installed(subproject.name, package)
+
+    def _install_all_packages(self, subprojects: List[SubprojectInfo]) -> None:
+        """Install every subproject's requirements with one pip call (--batch-pip).
+
+        Requirements are merged by package name. A subproject that asks for a
+        different spec of a package already in the merged set is warned about
+        and installed on its own afterwards, so every logged install names the
+        spec pip actually received. If the merged install fails, each
+        subproject is installed on its own so the failure is attributed to the
+        subproject that caused it.
+        """
+        merged: Dict[str, Package] = {}
+        batched: List[SubprojectInfo] = []
+        separate: List[SubprojectInfo] = []
+        for subproject in subprojects:
+            conflicts = [
+                (package, merged[name])
+                for name, package in subproject.requirements.items()
+                if name in merged and str(merged[name]) != str(package)
+            ]
+            if conflicts:
+                for package, kept in conflicts:
+                    logger.warning(
+                        "%s requires %s but %s is already in the merged install; "
+                        "installing %s separately",
+                        subproject.name,
+                        package,
+                        kept,
+                        subproject.name,
                     )
-                    failed_packages.append(str(package))
+                separate.append(subproject)
+                continue
+            for name, package in subproject.requirements.items():
+                merged.setdefault(name, package)
+            batched.append(subproject)
 
-            if failed_packages:
-                error_msg = "Failed to install packages: " + ", ".join(failed_packages)
-                logger.warning("%s", error_msg)
-                subproject.error = error_msg
+        if merged:
+            with self._pip_lock:
+                success, error = self.pip_installer.install_packages(
+                    list(merged.values()), self.env_path
+                )
+            if success:
+                for subproject in batched:
+                    self._log_installed(subproject, list(subproject.requirements.values()))
+            else:
+                logger.warning("Merged install failed, installing per subproject: %s", error)
+                separate = batched + separate
 
-        except Exception as e:
-            error_msg = f"Error processing subproject: {e!s}"
-            logger.error("%s", error_msg)
-            subproject.error = error_msg
-            self.test_mode.log_operation(
-                False, error_msg, project_name=subproject.name
+        for subproject in separate:
+            try:
+                self._install_packages(subproject)
+            except Exception as e:
+                self._record_failure(subproject, e)
+
+    def _install_packages(self, subproject: SubprojectInfo) -> None:
+        """Install one subproject's requirements, falling back to per-package installs."""
+        packages = list(subproject.requirements.values())
+        if not packages:
+            return
+
+        with self._pip_lock:
+            batch_ok, batch_error = self.pip_installer.install_packages(
+                packages, self.env_path
             )
+        if batch_ok:
+            self._log_installed(subproject, packages)
+            return
+
+        # One bad requirement fails the whole batch; retry individually so
+        # the rest still install and the failures are attributed.
+        logger.warning(
+            "Batch install failed for %s, retrying per package: %s",
+            subproject.name,
+            batch_error,
+        )
+        failed_packages: List[str] = []
+
+        for package in packages:
+            # The full requirement spec ("name>=1.0") goes to pip as-is.
+            pkg_str = str(package)
+            with self._pip_lock:
+                success, error = self.pip_installer.install_package(
+                    pkg_str, None, self.env_path
+                )
+            if success:
+                self._log_installed(subproject, [package])
+            else:
+                logger.warning("Failed to install %s: %s", pkg_str, error)
+                self.test_mode.log_operation(
+                    False,
+                    f"Failed to install {pkg_str}: {error}",
+                    project_name=subproject.name,
+                )
+                failed_packages.append(pkg_str)
+
+        if failed_packages:
+            error_msg = "Failed to install packages: " + ", ".join(failed_packages)
+            logger.warning("%s", error_msg)
+            subproject.error = error_msg
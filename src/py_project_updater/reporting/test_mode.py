@@ -1,13 +1,44 @@
 """Test mode operations and summary formatting."""
 
 import logging
+import re
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from py_project_updater.models import OperationResult, SubprojectInfo
+from py_project_updater.models import (
+    OperationResult,
+    OpKind,
+    Package,
+    SubprojectInfo,
+    VersionSpecifier,
+)
 
 logger = logging.getLogger(__name__)
 
+_GIT_STATUS_ORDER = {
+    "Repository is clean": 0,
+    "Repository has uncommitted changes": 1,
+    "Repository has unpushed commits": 2,
+}
+
+_CLASSIFY_RE = re.compile(r"installed|warning|pull|fetch|status", re.IGNORECASE)
+_KEYWORD_KINDS = {
+    "installed": OpKind.INSTALL,
+    "warning": OpKind.WARNING,
+    "pull": OpKind.PULL,
+    "fetch": OpKind.FETCH,
+    "status": OpKind.STATUS,
+}
+
+
+def _classify(message: str) -> OpKind:
+    """Return the OpKind flags for every keyword that appears in message."""
+    kind = OpKind.NONE
+    for m in _CLASSIFY_RE.finditer(message):
+        kind |= _KEYWORD_KINDS[m.group(0).lower()]
+    return kind
+
 
 class TestModeManager:
     """Manages test mode operations and logging."""
@@ -22,6 +53,8 @@ class TestModeManager:
         self.operations: List[OperationResult] = []
         self.subprojects = subprojects or []
         self.root_path = root_path
+        # Subprojects are processed concurrently; operations is the shared state.
+        self._lock = threading.Lock()
 
     def log_operation(
         self,
@@ -32,24 +65,66 @@ class TestModeManager:
         project_name: Optional[str] = None,
     ) -> None:
         """Log an operation and its result."""
+        kind = _classify(message)
+        package_name = package_version = None
+        if kind & OpKind.INSTALL:
+            # "Installed <spec>": split name==version once here, not per summary.
+            parts = message.split()
+            if len(parts) >= 2:
+                package_name, sep, package_version = parts[1].partition("==")
+                if not sep:
+                    package_version = "any"
         result = OperationResult(
             success=success,
             message=message,
             command=command,
             changes=changes or [],
             project_name=project_name,
+            kind=kind,
+            package_name=package_name,
+            package_version=package_version,
         )
-        self.operations.append(result)
+        self._record(result, command, changes)
+
+    def log_installed(self, project_name: str, package: Package) -> None:
+        """Log a successful install without re-parsing a formatted message."""
+        spec = str(package)
+        version = package.version
+        # Same keys log_operation derives from "name==version": only exact pins
+        # split into name and version, anything else is keyed by the full spec.
+        if version is not None and version.specifier is VersionSpecifier.EXACT:
+            package_name, package_version = package.name, version.version
+        else:
+            package_name, package_version = spec, "any"
+        result = OperationResult(
+            success=True,
+            message=f"Installed {spec}",
+            project_name=project_name,
+            kind=OpKind.INSTALL,
+            package_name=package_name,
+            package_version=package_version,
+        )
+        self._record(result)
+
+    def _record(
+        self,
+        result: OperationResult,
+        command: Optional[str] = None,
+        changes: Optional[List[str]] = None,
+    ) -> None:
+        with self._lock:
+            self.operations.append(result)
 
+        message = result.message
         if self.enabled:
-            logger.info(f"[TEST] {message}")
+            logger.info("[TEST] %s", message)
             if command:
-                logger.info(f"[TEST] Would execute: {command}")
+                logger.info("[TEST] Would execute: %s", command)
             if changes:
                 for change in changes:
-                    logger.info(f"[TEST] Would make change: {change}")
+                    logger.info("[TEST] Would make change: %s", change)
         else:
-            if success:
+            if result.success:
                 logger.info(message)
             else:
                 logger.warning(message)
@@ -58,26 +133,17 @@ class TestModeManager:
         self,
     ) -> Tuple[Dict[str, List[Tuple[str, str]]], Dict[str, List[str]]]:
         """Analyze package installations for conflicts and unique installs."""
+        if not any(op.kind & OpKind.INSTALL for op in self.operations):
+            return {}, {}
+
         package_versions: Dict[str, Dict[str, str]] = {}
         unique_packages: Dict[str, List[str]] = {}
 
         for op in self.operations:
-            if not op.success or not op.project_name:
+            if not op.success or not op.project_name or op.package_name is None:
                 continue
-
-            if "installed" in op.message.lower():
-                parts = op.message.split()
-                if len(parts) >= 2:
-                    package_spec = parts[1]
-                    if "==" in package_spec:
-                        package, version = package_spec.split("==", 1)
-                    else:
-                        package = package_spec
-                        version = "any"
-
-                    if package not in package_versions:
-                        package_versions[package] = {}
-                    package_versions[package][op.project_name] = version
+            version = op.package_version if op.package_version is not None else "any"
+            package_versions.setdefault(op.package_name, {})[op.project_name] = version
 
         conflicts: Dict[str, List[Tuple[str, str]]] = {}
         for package, versions in package_versions.items():
@@ -107,6 +173,9 @@ class TestModeManager:
 
         logger.debug(f"Projects with operations: {list(project_ops.keys())}")
 
+        if not project_ops:
+            return "\nTest Mode Summary:\n(no operations)"
+
         summary = ["\nTest Mode Summary:"]
         success_projects: List[Tuple] = []
         warning_projects: List[Tuple[str, str]] = []
@@ -116,41 +185,58 @@ class TestModeManager:
         project_info = {p.name: p for p in self.subprojects}
         logger.debug(f"Project info: {project_info}")
 
+        sort_keys: Dict[str, Tuple[str, int, str, str]] = {}
+        # Name column widths, tracked as rows are added.
+        error_name_len = warning_name_len = details_name_len = 0
+
         for project, ops in project_ops.items():
             logger.debug(f"Processing project: {project}")
-            if project_info.get(project) and project_info[project].path == self.root_path:
+            info = project_info.get(project)
+            if info and info.path == self.root_path:
                 logger.debug(f"Skipping main project: {project}")
                 continue
 
-            has_errors = any(not op.success for op in ops)
-            has_warnings = any("warning" in op.message.lower() for op in ops)
-            install_count = sum(
-                1 for op in ops if op.success and "installed" in op.message.lower()
-            )
-
-            git_status = None
-            git_operation = None
+            # One pass over the project's operations collects everything below.
+            error_msg: Optional[str] = None
+            warning_msg: Optional[str] = None
+            install_count = 0
+            git_status: Optional[str] = None
+            git_operation: Optional[str] = None
             for op in ops:
-                if op.success and (
-                    "pull" in op.message.lower() or "fetch" in op.message.lower()
-                ):
-                    git_operation = "pull" if "pull" in op.message.lower() else "fetch"
-                elif op.success and "status" in op.message.lower():
+                kind = op.kind
+                if not op.success:
+                    if error_msg is None:
+                        error_msg = op.message
+                    continue
+                if warning_msg is None and kind & OpKind.WARNING:
+                    warning_msg = op.message
+                if kind & OpKind.INSTALL:
+                    install_count += 1
+                if kind & (OpKind.PULL | OpKind.FETCH):
+                    git_operation = "pull" if kind & OpKind.PULL else "fetch"
+                elif kind & OpKind.STATUS:
                     git_status = op.message.split(":")[-1].strip()
 
-            subproject_error = project_info.get(
-                project, SubprojectInfo(None, None, project)
-            ).error
+            if info:
+                parent_name = info.parent_path.name if info.parent_path else ""
+                git_status_order = (
+                    _GIT_STATUS_ORDER.get(git_status, 3) if git_status else 3
+                )
+                sort_keys[project] = (parent_name, git_status_order, git_status or "", project)
+            else:
+                sort_keys[project] = ("", 4, "", project)
+
+            subproject_error = info.error if info else None
 
-            if has_errors:
-                error_msg = next(op for op in ops if not op.success).message
+            if error_msg is not None:
                 error_projects.append((project, error_msg))
+                error_name_len = max(error_name_len, len(project))
                 if subproject_error:
                     error_details.append((project, subproject_error))
-            elif has_warnings:
-                warning_projects.append(
-                    (project, next(op for op in ops if "warning" in op.message.lower()).message)
-                )
+                    details_name_len = max(details_name_len, len(project))
+            elif warning_msg is not None:
+                warning_projects.append((project, warning_msg))
+                warning_name_len = max(warning_name_len, len(project))
             else:
                 success_projects.append(
                     (project, install_count, git_status, git_operation, subproject_error)
@@ -161,72 +247,65 @@ class TestModeManager:
         logger.debug(f"Error projects: {error_projects}")
 
         def sort_key(item):
-            project_name = item[0]
-            info = project_info.get(project_name)
-            if not info:
-                return (0, 4, "", project_name)
-
-            git_status = None
-            for op in project_ops.get(project_name, []):
-                if op.success and "status" in op.message.lower():
-                    git_status = op.message.split(":")[-1].strip()
-                    break
-
-            parent_name = info.parent_path.name if info.parent_path else ""
-            status_order = {
-                "Repository is clean": 0,
-                "Repository has uncommitted changes": 1,
-                "Repository has unpushed commits": 2,
-            }
-            git_status_order = status_order.get(git_status, 3) if git_status else 3
-            return (parent_name, git_status_order, git_status or "", project_name)
+            return sort_keys[item[0]]
 
         if error_projects:
             summary.append("\nProjects with errors:")
-            max_name_len = max(len(name) for name, _ in error_projects)
             summary.extend(
-                f"  {name:<{max_name_len}}  {msg}"
+                f"  {name:<{error_name_len}}  {msg}"
                 for name, msg in sorted(error_projects, key=sort_key)
             )
 
         if warning_projects:
             summary.append("\nProjects with warnings:")
-            max_name_len = max(len(name) for name, _ in warning_projects)
             summary.extend(
-                f"  {name:<{max_name_len}}  {msg}"
+                f"  {name:<{warning_name_len}}  {msg}"
                 for name, msg in sorted(warning_projects, key=sort_key)
             )
 
         if success_projects:
             summary.append("\nSuccessful projects:")
-            max_name_len = max(len(name) for name, _, _, _, _ in success_projects) + 1
-            max_pkg_len = (
-                max(len(str(install_count)) for _, install_count, _, _, _ in success_projects)
-                + 1
-            )
-            max_git_len = (
-                max(len(git_status or "") for _, _, git_status, _, _ in success_projects) + 1
-            )
-            max_error_len = max(len(error or "") for _, _, _, _, error in success_projects) + 1
-
-            summary.append(
-                f"  {'Project':<{max_name_len}}  {'Pkgs':<{max_pkg_len}}  "
-                f"{'Git Status':<{max_git_len}}  {'Operation':<10}  {'Error':<{max_error_len}}"
-            )
-
+            # Materialize each cell once and track column widths in the same pass.
+            rows: List[Tuple[str, str, str, str, str]] = []
+            max_name_len = max_pkg_len = max_git_len = max_error_len = 0
             for name, install_count, git_status, git_operation, error in sorted(
                 success_projects, key=sort_key
             ):
-                install_str = str(install_count) if install_count else ""
-                operation = f"({git_operation})" if git_operation else ""
-                error_fmt = (
-                    error.replace("\n", "\n" + " " * (max_name_len + 4)) if error else ""
-                )
-                summary.append(
-                    f"  {name:<{max_name_len}}  {install_str:<{max_pkg_len}}  "
-                    f"{git_status or '':<{max_git_len}}  {operation:<10}  "
-                    f"{error_fmt or '':<{max_error_len}}"
+                count_str = str(install_count)
+                git_str = git_status or ""
+                error_str = error or ""
+                if len(name) > max_name_len:
+                    max_name_len = len(name)
+                if len(count_str) > max_pkg_len:
+                    max_pkg_len = len(count_str)
+                if len(git_str) > max_git_len:
+                    max_git_len = len(git_str)
+                if len(error_str) > max_error_len:
+                    max_error_len = len(error_str)
+                rows.append(
+                    (
+                        name,
+                        count_str if install_count else "",
+                        git_str,
+                        f"({git_operation})" if git_operation else "",
+                        error_str,
+                    )
                 )
+            max_name_len += 1
+            max_pkg_len += 1
+            max_git_len += 1
+            max_error_len += 1
+
+            row_fmt = (
+                f"  {{:<{max_name_len}}}  {{:<{max_pkg_len}}}  "
+                f"{{:<{max_git_len}}}  {{:<10}}  {{:<{max_error_len}}}"
+            ).format
+            err_indent = "\n" + " " * (max_name_len + 4)
+
+            summary.append(row_fmt("Project", "Pkgs", "Git Status", "Operation", "Error"))
+            for name, install_str, git_str, operation, error_str in rows:
+                error_fmt = error_str.replace("\n", err_indent)
+                summary.append(row_fmt(name, install_str, git_str, operation, error_fmt))
 
         conflicts, unique_packages = self._analyze_package_conflicts()
 
@@ -250,11 +329,9 @@ class TestModeManager:
 
         if error_details:
             summary.append("\nDetailed Error Information:")
-            max_name_len = max(len(name) for name, _ in error_details)
+            err_indent = "\n" + " " * (details_name_len + 4)
             for project, error in sorted(error_details, key=sort_key):
-                formatted_error = error.replace(
-                    "\n", "\n" + " " * (max_name_len + 4)
-                )
-                summary.append(f"  {project:<{max_name_len}}  {formatted_error}")
+                formatted_error = error.replace("\n", err_indent)
+                summary.append(f"  {project:<{details_name_len}}  {formatted_error}")
 
         return "\n".join(summary)
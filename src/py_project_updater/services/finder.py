@@ -1,8 +1,9 @@
 """SubprojectFinder: discover subprojects with requirements.txt or .git."""
 
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AbstractSet, Dict, Iterator, List, Optional, Tuple
 
 from py_project_updater.models import Package, SubprojectInfo
 
@@ -18,6 +19,7 @@ class SubprojectFinder:
         root_path: Path,
         max_depth: int,
         requirements_file: Optional[Path] = None,
+        nesting: Tuple[Optional[Path], bool] = (None, False),
     ) -> Optional[SubprojectInfo]:
         """Create a SubprojectInfo for a given path.
 
@@ -26,27 +28,16 @@ class SubprojectFinder:
             root_path: Project root path.
             max_depth: Maximum depth to search.
             requirements_file: Path to requirements.txt, if any.
+            nesting: (parent_path, is_nested) as computed by _compute_nesting.
 
         Returns:
             SubprojectInfo if valid, None if path should be skipped.
         """
-        if any(part.startswith(".") for part in path.parts):
-            return None
-
         depth = len(path.relative_to(root_path).parts)
         if depth > max_depth:
             return None
 
-        parent_path: Optional[Path] = None
-        is_nested = False
-        for parent in path.parents:
-            if parent == root_path:
-                break
-            if (parent / "requirements.txt").exists() or (parent / ".git").is_dir():
-                parent_path = parent
-                is_nested = True
-                break
-
+        parent_path, is_nested = nesting
         subproject_name = path.name
         requirements = (
             SubprojectFinder._parse_requirements(requirements_file)
@@ -64,54 +55,99 @@ class SubprojectFinder:
         )
 
     @staticmethod
-    def find_subprojects(root_path: Path, max_depth: int = 2) -> List[SubprojectInfo]:
+    def _compute_nesting(
+        candidate_dirs: AbstractSet[Path], root_path: Path
+    ) -> Dict[Path, Tuple[Optional[Path], bool]]:
+        """Map each candidate to (closest enclosing candidate, is_nested).
+
+        Works purely on the discovered set; the root never counts as a parent.
+        """
+        nesting: Dict[Path, Tuple[Optional[Path], bool]] = {}
+        for path in candidate_dirs:
+            parent_path: Optional[Path] = None
+            for parent in path.parents:
+                if parent == root_path:
+                    break
+                if parent in candidate_dirs:
+                    parent_path = parent
+                    break
+            nesting[path] = (parent_path, parent_path is not None)
+        return nesting
+
+    @staticmethod
+    def _walk(
+        root_path: Path, max_depth: int, ignored: AbstractSet[str] = frozenset()
+    ) -> Iterator[Tuple[Path, Optional[Path]]]:
+        """Yield (directory, requirements_file) for each subproject candidate.
+
+        A single depth-bounded os.scandir walk: hidden and ignored directories
+        are pruned and nothing deeper than max_depth is opened. A directory is a
+        candidate when it contains a .git directory or a requirements.txt file.
+        """
+        stack: List[Tuple[str, int]] = [(os.fspath(root_path), 0)]
+        while stack:
+            dir_path, depth = stack.pop()
+            has_git = False
+            has_req = False
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        name = entry.name
+                        if name == ".git":
+                            has_git = has_git or entry.is_dir()
+                        elif name == "requirements.txt":
+                            has_req = has_req or entry.is_file()
+                        elif (
+                            depth < max_depth
+                            and not name.startswith(".")
+                            and name not in ignored
+                            and entry.is_dir(follow_symlinks=False)
+                        ):
+                            stack.append((entry.path, depth + 1))
+            except OSError as e:
+                logger.warning("Cannot scan %s: %s", dir_path, e)
+                continue
+
+            if has_git or has_req:
+                path = Path(dir_path)
+                yield path, (path / "requirements.txt") if has_req else None
+
+    @staticmethod
+    def find_subprojects(
+        root_path: Path, max_depth: int = 2, ignored: AbstractSet[str] = frozenset()
+    ) -> List[SubprojectInfo]:
         """Find all subprojects with requirements.txt or Git repositories.
 
         Args:
             root_path: Root directory to search from.
             max_depth: Maximum depth to search (default: 2).
+            ignored: Directory names that are neither reported nor descended into.
         """
         subprojects: List[SubprojectInfo] = []
-        processed_paths: set = set()
-
-        for git_dir in root_path.rglob(".git"):
-            if git_dir.is_dir():
-                subproject_path = git_dir.parent
-                if subproject_path not in processed_paths:
-                    processed_paths.add(subproject_path)
-                    req_file = subproject_path / "requirements.txt"
-                    subproject = SubprojectFinder._create_subproject(
-                        subproject_path,
-                        root_path,
-                        max_depth,
-                        req_file if req_file.exists() else None,
-                    )
-                    if subproject:
-                        subprojects.append(subproject)
-
-        for req_file in root_path.rglob("requirements.txt"):
-            subproject_path = req_file.parent
-            if subproject_path not in processed_paths:
-                processed_paths.add(subproject_path)
-                subproject = SubprojectFinder._create_subproject(
-                    subproject_path, root_path, max_depth, req_file
-                )
-                if subproject:
-                    subprojects.append(subproject)
-
+        candidates = list(SubprojectFinder._walk(root_path, max_depth, ignored))
+        nesting = SubprojectFinder._compute_nesting(
+            {subproject_path for subproject_path, _ in candidates}, root_path
+        )
+        for subproject_path, req_file in candidates:
+            subproject = SubprojectFinder._create_subproject(
+                subproject_path, root_path, max_depth, req_file, nesting[subproject_path]
+            )
+            if subproject:
+                subprojects.append(subproject)
         return subprojects
 
     @staticmethod
     def _parse_requirements(req_file: Path) -> Dict[str, Package]:
         """Parse a requirements.txt into a package name -> Package mapping."""
         requirements: Dict[str, Package] = {}
-        with open(req_file, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    try:
-                        pkg = Package.from_string(line)
-                        requirements[pkg.name] = pkg
-                    except Exception as e:
-                        logger.warning("Error parsing line %r: %s", line, e)
+        text = req_file.read_text(encoding="utf-8", errors="replace")
+        for raw in text.splitlines():
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                pkg = Package.from_string(line)
+                requirements[pkg.name] = pkg
+            except Exception as e:
+                logger.warning("Error parsing line %r: %s", line, e)
         return requirements
@@ -1,15 +1,194 @@
 """Git operations for subprojects."""
 
+import hashlib
+import json
 import logging
+import os
 import shutil
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
-
+from typing import (
+    IO,
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from py_project_updater.config import default_cache_dir
 from py_project_updater.reporting import TestModeManager
+from py_project_updater.services import git_backend
 
 logger = logging.getLogger(__name__)
 
+MAX_GIT_WORKERS = 32
+MAX_DELETE_WORKERS = 8
+TRACKED_FILES_CACHE_DIR = default_cache_dir()
+# Resolved once so each spawn skips the PATH (and PATHEXT) search.
+GIT_EXECUTABLE = shutil.which("git") or "git"
+
+
+class GitStatus(NamedTuple):
+    """Result of GitManager.get_git_status."""
+
+    is_clean: bool
+    message: str
+    was_cleaned_by_filtering: bool
+
+
+def _tracked_cache_file(repo_path: Path) -> Path:
+    key = hashlib.blake2b(str(repo_path.resolve()).encode(), digest_size=16).hexdigest()
+    return TRACKED_FILES_CACHE_DIR / f"{key}.json"
+
+
+def _load_tracked_cache(repo_path: Path, index_mtime_ns: int) -> Optional[FrozenSet[str]]:
+    """Return cached tracked files if they were recorded for this index mtime."""
+    try:
+        with open(_tracked_cache_file(repo_path), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("mtime") != index_mtime_ns:
+        return None
+    return frozenset(data.get("files", []))
+
+
+def _save_tracked_cache(repo_path: Path, index_mtime_ns: int, files: FrozenSet[str]) -> None:
+    cache_file = _tracked_cache_file(repo_path)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"mtime": index_mtime_ns, "files": sorted(files)}, f)
+    except OSError as e:
+        logger.debug("Could not write tracked-files cache %s: %s", cache_file, e)
+
+
+def _split_ignore_patterns(
+    patterns: Sequence[str],
+) -> Tuple[FrozenSet[str], Tuple[str, ...], FrozenSet[str], Tuple[str, ...]]:
+    """Split glob patterns into (file names, file suffixes, dir names, dir suffixes).
+
+    Patterns ending in "/" match directories; a leading "*" makes a suffix match.
+    """
+    file_names: Set[str] = set()
+    file_suffixes: List[str] = []
+    dir_names: Set[str] = set()
+    dir_suffixes: List[str] = []
+    for pattern in patterns:
+        is_dir = pattern.endswith("/")
+        name = pattern.rstrip("/")
+        if name.startswith("*"):
+            (dir_suffixes if is_dir else file_suffixes).append(name[1:])
+        else:
+            (dir_names if is_dir else file_names).add(name)
+    return frozenset(file_names), tuple(file_suffixes), frozenset(dir_names), tuple(dir_suffixes)
+
+
+# Pulls and fetches run for many repos at once; keep them from starting gc.
+_NO_AUTO_GC = ("-c", "gc.auto=0")
+
+# Field count before the path in each porcelain v2 entry type.
+_V2_PATH_FIELD = {"1": 8, "2": 9, "u": 10}
+
+
+def _porcelain_v1_line(line: str) -> str:
+    """Convert a porcelain v2 change entry to the v1 "XY path" form."""
+    kind = line[0]
+    if kind in ("?", "!"):
+        return f"{kind * 2} {line[2:]}"
+    fields = line.split(" ", _V2_PATH_FIELD.get(kind, 1))
+    return f"{fields[1]} {fields[-1]}"
+
+
+def _nul_records(stream: IO[bytes], chunk_size: int = 65536) -> Iterator[str]:
+    """Yield NUL-terminated records from a binary stream as they arrive."""
+    pending = b""
+    while True:
+        chunk = stream.read1(chunk_size)
+        if not chunk:
+            break
+        *records, pending = (pending + chunk).split(b"\0")
+        for record in records:
+            yield record.decode("utf-8", "replace")
+    if pending:
+        yield pending.decode("utf-8", "replace")
+
+
+def _log_rmtree_error(func, path, exc) -> None:
+    # exc is an exception (onexc) or an exc_info tuple (onerror).
+    err = exc[1] if isinstance(exc, tuple) else exc
+    logger.warning(f"Failed to remove {path}: {str(err)}")
+
+
+def _remove_artifact(path: str, is_dir: bool) -> None:
+    """Delete one artifact, logging rather than raising on failure."""
+    if is_dir:
+        # Keep removing the rest of the tree past entries that cannot be deleted.
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=_log_rmtree_error)
+        else:
+            shutil.rmtree(path, onerror=_log_rmtree_error)
+        logger.info(f"Removed directory: {path}")
+        return
+    try:
+        os.unlink(path)
+        logger.info(f"Removed file: {path}")
+    except Exception as e:
+        logger.warning(f"Failed to remove file {path}: {str(e)}")
+
+
+def git_env() -> Dict[str, str]:
+    """Return the environment for git child processes.
+
+    The caller's environment is kept (credentials, SSH agent, config) with
+    prompts disabled, a C locale, and no optional index lock for status.
+    """
+    env = dict(os.environ)
+    env.update(GIT_TERMINAL_PROMPT="0", LC_ALL="C", GIT_OPTIONAL_LOCKS="0")
+    return env
+
+
+def _run_git(
+    repo: Path, args: Sequence[str], env: Optional[Dict[str, str]] = None
+) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [GIT_EXECUTABLE, *args],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+
+def run_git_batch(
+    repos: Sequence[Path], args: Sequence[str]
+) -> Dict[Path, subprocess.CompletedProcess]:
+    """Run the same read-only git command in each repo concurrently.
+
+    Git startup dominates these calls, so they are fanned out over a thread
+    pool. Repos where git could not be started are omitted from the result.
+    """
+    results: Dict[Path, subprocess.CompletedProcess] = {}
+    if not repos:
+        return results
+    env = git_env()
+    with ThreadPoolExecutor(max_workers=min(MAX_GIT_WORKERS, len(repos))) as pool:
+        futures = {repo: pool.submit(_run_git, repo, args, env) for repo in repos}
+        for repo, future in futures.items():
+            try:
+                results[repo] = future.result()
+            except Exception as e:
+                logger.warning("git %s failed in %s: %s", " ".join(args), repo, e)
+    return results
+
 
 class GitManager:
     """Handles Git operations for subprojects."""
@@ -31,56 +210,103 @@ class GitManager:
         "dist/",
         "*.egg",
     ]
+    (
+        _ARTIFACT_FILE_NAMES,
+        _ARTIFACT_FILE_SUFFIXES,
+        _ARTIFACT_DIR_NAMES,
+        _ARTIFACT_DIR_SUFFIXES,
+    ) = _split_ignore_patterns(PYTHON_IGNORE_PATTERNS)
+    # Status-line matching: literal patterns as a filename suffix (with and
+    # without the trailing "/" git prints for untracked dirs) and, for
+    # directories, as a path prefix. Glob patterns ("*.so") only match
+    # untracked entries, so a modified tracked binary still counts as a change.
+    _IGNORED_SUFFIXES = tuple(
+        sorted(
+            {p.rstrip("/") for p in PYTHON_IGNORE_PATTERNS if not p.startswith("*")}
+            | {p for p in PYTHON_IGNORE_PATTERNS if p.endswith("/") and not p.startswith("*")}
+        )
+    )
+    _UNTRACKED_IGNORED_SUFFIXES = tuple(
+        sorted(
+            {p.rstrip("/")[1:] for p in PYTHON_IGNORE_PATTERNS if p.startswith("*")}
+            | {p[1:] for p in PYTHON_IGNORE_PATTERNS if p.endswith("/") and p.startswith("*")}
+        )
+    )
+    _IGNORED_PREFIXES = tuple(
+        p for p in PYTHON_IGNORE_PATTERNS if p.endswith("/") and not p.startswith("*")
+    )
 
     def __init__(self, test_mode: TestModeManager):
         self.test_mode = test_mode
+        self._env = git_env()
+        # Per-run memo of git queries, keyed by resolved repo path. Status is
+        # dropped whenever this manager changes the work tree; remotes are not.
+        self._status_cache: Dict[Path, GitStatus] = {}
+        self._remote_cache: Dict[Path, Optional[str]] = {}
 
     def is_git_repo(self, path: Path) -> bool:
         """Check if a directory is a Git repository."""
+        return self.is_git_repos([path])[path]
+
+    def is_git_repos(self, paths: List[Path]) -> Dict[Path, bool]:
+        """Check which directories are Git repositories.
+
+        A subproject is a repository when it has its own .git: a directory with
+        a HEAD file, or a gitfile as used by submodules and worktrees. This is a
+        filesystem check; no git process is started.
+        """
         if self.test_mode.enabled:
-            self.test_mode.log_operation(
-                True,
-                f"Checking if {path} is a Git repository",
-                "git rev-parse --is-inside-work-tree",
-            )
-            return True
+            for path in paths:
+                self.test_mode.log_operation(
+                    True,
+                    f"Checking if {path} is a Git repository",
+                    "git rev-parse --is-inside-work-tree",
+                )
+            return {path: True for path in paths}
 
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--is-inside-work-tree"],
-                cwd=path,
-                capture_output=True,
-                text=True,
-            )
-            return result.returncode == 0 and result.stdout.strip() == "true"
-        except Exception:
-            return False
+        return {path: self._has_own_git(path) for path in paths}
+
+    @staticmethod
+    def _has_own_git(path: Path) -> bool:
+        git = path / ".git"
+        return git.is_file() or (git / "HEAD").is_file()
 
     def get_remote_url(self, path: Path) -> Optional[str]:
         """Get the remote URL for a Git repository."""
-        if self.test_mode.enabled:
-            self.test_mode.log_operation(
-                True,
-                f"Getting remote URL for {path}",
-                "git remote get-url origin",
-            )
-            return f"https://github.com/test/{path.name}.git"
+        return self.get_remote_urls([path])[path]
 
-        try:
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                cwd=path,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                url = result.stdout.strip()
-                if url.startswith("git@github.com:"):
-                    url = url.replace("git@github.com:", "https://github.com/")
-                return url
-            return None
-        except Exception:
-            return None
+    def get_remote_urls(self, paths: List[Path]) -> Dict[Path, Optional[str]]:
+        """Get the origin remote URL for each repository, querying git concurrently."""
+        if self.test_mode.enabled:
+            for path in paths:
+                self.test_mode.log_operation(
+                    True,
+                    f"Getting remote URL for {path}",
+                    "git remote get-url origin",
+                )
+            return {path: f"https://github.com/test/{path.name}.git" for path in paths}
+
+        keys = {path: path.resolve() for path in paths}
+        missing = [path for path in paths if keys[path] not in self._remote_cache]
+
+        raw: Dict[Path, Optional[str]] = {}
+        if git_backend.available():
+            raw = {path: git_backend.get_remote_url(path) for path in missing}
+            # The backend answers None when libgit2 cannot open the repository
+            # (ownership checks, unsupported extensions); ask the CLI instead.
+            missing = [path for path in missing if raw[path] is None]
+        if missing:
+            results = run_git_batch(missing, ["remote", "get-url", "origin"])
+            for path in missing:
+                result = results.get(path)
+                ok = result is not None and result.returncode == 0
+                raw[path] = result.stdout.strip() if ok else None
+
+        for path, url in raw.items():
+            if url is not None and url.startswith("git@github.com:"):
+                url = url.replace("git@github.com:", "https://github.com/")
+            self._remote_cache[keys[path]] = url
+        return {path: self._remote_cache[keys[path]] for path in paths}
 
     def _clean_python_artifacts(self, path: Path) -> None:
         """Restore modified/deleted files to their tracked state."""
@@ -94,155 +320,216 @@ class GitManager:
 
         try:
             subprocess.run(
-                ["git", "checkout", "--", "."],
+                [GIT_EXECUTABLE, "checkout", "--", "."],
                 cwd=path,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=self._env,
             )
 
+            tracked_files = self._list_tracked_files(path)
+            if tracked_files is None:
+                return
+
+            tracked_dirs: Set[str] = set()
+            for file in tracked_files:
+                parent, sep, _ = file.rpartition("/")
+                while sep and parent not in tracked_dirs:
+                    tracked_dirs.add(parent)
+                    parent, sep, _ = parent.rpartition("/")
+
+            dirs_to_remove, files_to_remove = self._find_artifacts(
+                path, tracked_files, tracked_dirs
+            )
+            targets = [(d, True) for d in dirs_to_remove] + [(f, False) for f in files_to_remove]
+            if targets:
+                # Deletion is bound by filesystem latency, so overlap it.
+                workers = min(MAX_DELETE_WORKERS, len(targets))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for _ in pool.map(lambda t: _remove_artifact(*t), targets):
+                        pass
+        except Exception as e:
+            logger.warning(f"Warning: Failed to restore files: {str(e)}")
+
+    def _list_tracked_files(self, path: Path) -> Optional[FrozenSet[str]]:
+        """Return paths tracked by git (forward slashes), or None on failure.
+
+        The listing is cached on disk and reused while .git/index is unchanged.
+        """
+        try:
+            index_mtime_ns: Optional[int] = (path / ".git" / "index").stat().st_mtime_ns
+        except OSError:
+            index_mtime_ns = None
+        if index_mtime_ns is not None:
+            cached = _load_tracked_cache(path, index_mtime_ns)
+            if cached is not None:
+                return cached
+
+        tracked_list = git_backend.list_tracked_files(path)
+        if tracked_list is None:
+            # -z keeps paths unquoted; the listing is decoded in one pass.
             tracked_result = subprocess.run(
-                ["git", "ls-files"],
+                [GIT_EXECUTABLE, "ls-files", "-z"],
                 cwd=path,
                 capture_output=True,
-                text=True,
+                env=self._env,
             )
-
             if tracked_result.returncode != 0:
-                logger.warning(f"Failed to get tracked files: {tracked_result.stderr}")
-                return
-
-            tracked_files = set()
-            for file in tracked_result.stdout.strip().split("\n"):
-                if file:
-                    tracked_files.add(file)
-                    tracked_files.add(file.replace("/", "\\"))
-
-            for pattern in self.PYTHON_IGNORE_PATTERNS:
-                if pattern.endswith("/"):
-                    dir_pattern = pattern.rstrip("/")
-                    for dir_path in path.rglob(dir_pattern):
-                        if dir_path.is_dir():
-                            has_tracked_files = False
-                            for file_path in dir_path.rglob("*"):
-                                if file_path.is_file():
-                                    rel_path = str(file_path.relative_to(path))
-                                    if (
-                                        rel_path in tracked_files
-                                        or rel_path.replace("\\", "/") in tracked_files
-                                    ):
-                                        has_tracked_files = True
-                                        break
-
-                            if not has_tracked_files:
-                                try:
-                                    shutil.rmtree(dir_path)
-                                    logger.info(f"Removed directory: {dir_path}")
-                                except Exception as e:
-                                    logger.warning(
-                                        f"Failed to remove directory {dir_path}: {str(e)}"
-                                    )
-                else:
-                    for file_path in path.rglob(pattern):
-                        if file_path.is_file():
-                            rel_path = str(file_path.relative_to(path))
-                            if (
-                                rel_path not in tracked_files
-                                and rel_path.replace("\\", "/") not in tracked_files
-                            ):
-                                try:
-                                    file_path.unlink()
-                                    logger.info(f"Removed file: {file_path}")
-                                except Exception as e:
-                                    logger.warning(
-                                        f"Failed to remove file {file_path}: {str(e)}"
-                                    )
-        except Exception as e:
-            logger.warning(f"Warning: Failed to restore files: {str(e)}")
+                stderr = tracked_result.stderr.decode("utf-8", "replace")
+                logger.warning(f"Failed to get tracked files: {stderr}")
+                return None
+            tracked_list = tracked_result.stdout.decode("utf-8", "replace").split("\0")
+
+        tracked_files = frozenset(file for file in tracked_list if file)
+        if index_mtime_ns is not None:
+            _save_tracked_cache(path, index_mtime_ns, tracked_files)
+        return tracked_files
+
+    def _find_artifacts(
+        self, path: Path, tracked_files: AbstractSet[str], tracked_dirs: AbstractSet[str]
+    ) -> Tuple[List[str], List[str]]:
+        """Walk the work tree once and collect untracked artifact dirs and files.
+
+        Paths in tracked_files/tracked_dirs are relative with forward slashes,
+        as printed by git ls-files. Artifact directories that contain no
+        tracked files are collected whole and not descended into. .git is
+        skipped and symlinked directories are not followed.
+        """
+        dirs_to_remove: List[str] = []
+        files_to_remove: List[str] = []
+        stack: List[Tuple[str, str]] = [(os.fspath(path), "")]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.warning(f"Failed to scan {dir_path}: {str(e)}")
+                continue
+            for entry in entries:
+                name = entry.name
+                rel_path = rel_dir + name
+                if entry.is_dir(follow_symlinks=False):
+                    if name == ".git":
+                        continue
+                    if (
+                        name in self._ARTIFACT_DIR_NAMES
+                        or name.endswith(self._ARTIFACT_DIR_SUFFIXES)
+                    ) and rel_path not in tracked_dirs:
+                        dirs_to_remove.append(entry.path)
+                        continue
+                    stack.append((entry.path, rel_path + "/"))
+                elif (
+                    name in self._ARTIFACT_FILE_NAMES
+                    or name.endswith(self._ARTIFACT_FILE_SUFFIXES)
+                ) and rel_path not in tracked_files:
+                    files_to_remove.append(entry.path)
+        return dirs_to_remove, files_to_remove
 
     def _is_ignored_change(self, status_line: str) -> bool:
         """Check if a Git status line should be ignored."""
+        debug = logger.isEnabledFor(logging.DEBUG)
         if len(status_line) < 3:
-            logger.debug(f"Status line too short: {status_line}")
+            if debug:
+                logger.debug(f"Status line too short: {status_line}")
             return False
 
         index_status = status_line[0]
         working_status = status_line[1]
         filename = status_line[3:].strip()
 
-        logger.debug(f"Checking status line: {status_line}")
-        logger.debug(
-            f"Index status: {index_status}, Working status: {working_status}, "
-            f"Filename: {filename}"
-        )
+        if debug:
+            logger.debug(f"Checking status line: {status_line}")
+            logger.debug(
+                f"Index status: {index_status}, Working status: {working_status}, "
+                f"Filename: {filename}"
+            )
 
-        if working_status in ["?", "M"] or index_status in ["M", "A"]:
-            for pattern in self.PYTHON_IGNORE_PATTERNS:
-                matches = (
-                    filename.endswith(pattern.rstrip("/"))
-                    or (
-                        pattern.endswith("/")
-                        and filename.startswith(pattern)
-                    )
-                )
-                if matches:
-                    logger.debug(f"Match found! Pattern: {pattern}, Filename: {filename}")
-                    return True
-            logger.debug(f"No matches found for filename: {filename}")
+        if working_status in ("?", "M") or index_status in ("M", "A"):
+            if (
+                filename.endswith(self._IGNORED_SUFFIXES)
+                or filename.startswith(self._IGNORED_PREFIXES)
+                or (index_status == "?" and filename.endswith(self._UNTRACKED_IGNORED_SUFFIXES))
+            ):
+                if debug:
+                    logger.debug(f"Match found for filename: {filename}")
+                return True
+            if debug:
+                logger.debug(f"No matches found for filename: {filename}")
             return False
 
-        logger.debug(f"Status not relevant for ignore check: {status_line}")
+        if debug:
+            logger.debug(f"Status not relevant for ignore check: {status_line}")
         return False
 
-    def get_git_status(self, path: Path) -> Tuple[bool, str, bool]:
-        """Check Git status and return (is_clean, status_message, was_cleaned_by_filtering)."""
+    def get_git_status(self, path: Path) -> GitStatus:
+        """Check Git status and return (is_clean, message, was_cleaned_by_filtering).
+
+        The result is memoized per repository until this manager modifies it.
+        """
+        key = path.resolve()
+        cached = self._status_cache.get(key)
+        if cached is None:
+            cached = self._status_cache[key] = self._query_git_status(path)
+        return cached
+
+    def _invalidate_git_status(self, path: Path) -> None:
+        self._status_cache.pop(path.resolve(), None)
+
+    def _query_git_status(self, path: Path) -> GitStatus:
+        # Status entries are read as git prints them so a dirty repository can
+        # be reported, and git stopped, at the first change that is not ignored.
+        # The branch header, including the ahead count, always comes first.
+        # -z leaves paths unquoted; renames add the original path as its own
+        # record, which is skipped.
         try:
-            status_result = subprocess.run(
-                ["git", "status", "--porcelain"],
+            ahead = 0
+            was_cleaned_by_filtering = False
+            with subprocess.Popen(
+                [GIT_EXECUTABLE, "status", "--porcelain=v2", "--branch", "-z"],
                 cwd=path,
-                capture_output=True,
-                text=True,
-            )
-
-            if status_result.returncode != 0:
-                return False, "Failed to get Git status", False
-
-            raw_status_lines = status_result.stdout.strip().split("\n")
-            logger.debug(f"Raw Git status lines: {raw_status_lines}")
-
-            relevant_changes = []
-            for line in raw_status_lines:
-                if line:
-                    logger.debug(f"Processing status line: {line}")
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=self._env,
+            ) as proc:
+                skip_orig_path = False
+                for line in _nul_records(proc.stdout):
+                    if skip_orig_path:
+                        skip_orig_path = False
+                        continue
+                    if line.startswith("# branch.ab "):
+                        ahead = int(line.split()[2].lstrip("+"))
+                        continue
+                    if not line or line.startswith("#"):
+                        continue
+                    skip_orig_path = line[0] == "2"
+                    line = _porcelain_v1_line(line)
                     if not self._is_ignored_change(line):
-                        relevant_changes.append(line)
-                        logger.debug(f"Added to relevant changes: {line}")
-
-            was_cleaned_by_filtering = len(raw_status_lines) > len(relevant_changes)
-
-            if relevant_changes:
-                logger.debug(f"Found relevant changes: {relevant_changes}")
-                return False, "Repository has uncommitted changes", was_cleaned_by_filtering
+                        logger.debug("Found relevant change: %s", line)
+                        proc.terminate()
+                        return GitStatus(
+                            False, "Repository has uncommitted changes", was_cleaned_by_filtering
+                        )
+                    was_cleaned_by_filtering = True
+                returncode = proc.wait()
 
-            unpushed_result = subprocess.run(
-                ["git", "cherry", "-v"],
-                cwd=path,
-                capture_output=True,
-                text=True,
-            )
+            if returncode != 0:
+                return GitStatus(False, "Failed to get Git status", False)
 
-            if unpushed_result.stdout.strip():
-                return False, "Repository has unpushed commits", was_cleaned_by_filtering
+            if ahead > 0:
+                return GitStatus(False, "Repository has unpushed commits", was_cleaned_by_filtering)
 
-            return True, "Repository is clean", was_cleaned_by_filtering
+            return GitStatus(True, "Repository is clean", was_cleaned_by_filtering)
         except Exception as e:
-            return False, f"Error checking Git status: {str(e)}", False
+            return GitStatus(False, f"Error checking Git status: {str(e)}", False)
 
     def update_repository(self, path: Path) -> Tuple[bool, str]:
         """Update the repository based on its status."""
-        is_clean, status_msg, was_cleaned_by_filtering = self.get_git_status(path)
+        status = self.get_git_status(path)
+        is_clean = status.is_clean
 
         if self.test_mode.enabled:
-            if not is_clean or "up to date" not in status_msg.lower():
+            if not is_clean or "up to date" not in status.message.lower():
                 operation = "pull" if is_clean else "fetch"
                 self.test_mode.log_operation(
                     True,
@@ -255,23 +542,27 @@ class GitManager:
 
         try:
             if is_clean:
-                if was_cleaned_by_filtering:
+                # Only a cleanup can change what the first status check saw.
+                if status.was_cleaned_by_filtering:
                     self._clean_python_artifacts(path)
+                    self._invalidate_git_status(path)
 
-                is_clean_after, status_after, _ = self.get_git_status(path)
-                if not is_clean_after:
-                    logger.warning(
-                        f"Repository still not clean after cleaning artifacts: "
-                        f"{status_after}"
-                    )
-                    return False, f"Repository not clean: {status_after}"
+                    status_after = self.get_git_status(path)
+                    if not status_after.is_clean:
+                        logger.warning(
+                            f"Repository still not clean after cleaning artifacts: "
+                            f"{status_after.message}"
+                        )
+                        return False, f"Repository not clean: {status_after.message}"
 
                 pull_result = subprocess.run(
-                    ["git", "pull"],
+                    [GIT_EXECUTABLE, *_NO_AUTO_GC, "pull", "--ff-only"],
                     cwd=path,
                     capture_output=True,
                     text=True,
+                    env=self._env,
                 )
+                self._invalidate_git_status(path)
                 if pull_result.returncode == 0:
                     changes = pull_result.stdout.strip()
                     if changes:
@@ -280,11 +571,13 @@ class GitManager:
                 return False, f"Failed to pull changes: {pull_result.stderr.strip()}"
             else:
                 fetch_result = subprocess.run(
-                    ["git", "fetch"],
+                    [GIT_EXECUTABLE, *_NO_AUTO_GC, "fetch", "--prune"],
                     cwd=path,
                     capture_output=True,
                     text=True,
+                    env=self._env,
                 )
+                self._invalidate_git_status(path)
                 if fetch_result.returncode == 0:
                     return True, "Fetched changes (repository not clean)"
                 return False, f"Failed to fetch changes: {fetch_result.stderr.strip()}"
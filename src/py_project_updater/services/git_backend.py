@@ -0,0 +1,71 @@
+"""Optional in-process Git access through pygit2 (libgit2 bindings).
+
+Read-only queries are answered without spawning a git process when pygit2 is
+installed (``pip install py-project-updater[git]``). Every helper returns
+None when the backend is unavailable or cannot answer, and callers fall back
+to the git CLI. Mutating operations (pull, fetch, checkout) always use the CLI.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, List, Optional
+
+try:
+    import pygit2
+except ImportError:  # pragma: no cover - exercised only without the extra
+    pygit2 = None
+
+logger = logging.getLogger(__name__)
+
+
+def available() -> bool:
+    """Return True if pygit2 is importable."""
+    return pygit2 is not None
+
+
+def _open(path: Path) -> Optional[Any]:
+    if pygit2 is None:
+        return None
+    try:
+        return pygit2.Repository(str(path))
+    except (pygit2.GitError, KeyError, ValueError):
+        return None
+
+
+def get_remote_url(path: Path, remote: str = "origin") -> Optional[str]:
+    """Return the URL of the given remote, or None if unavailable or missing."""
+    repo = _open(path)
+    if repo is None:
+        return None
+    try:
+        return repo.remotes[remote].url
+    except (KeyError, IndexError):
+        return None
+
+
+def get_last_commit_date(path: Path) -> Optional[datetime]:
+    """Return the committer date of HEAD, or None if unavailable."""
+    repo = _open(path)
+    if repo is None:
+        return None
+    try:
+        commit = repo.head.peel(pygit2.Commit)
+    except (pygit2.GitError, KeyError, ValueError) as e:
+        logger.debug("Cannot resolve HEAD in %s: %s", path, e)
+        return None
+    tz = timezone(timedelta(minutes=commit.commit_time_offset))
+    return datetime.fromtimestamp(commit.commit_time, tz)
+
+
+def list_tracked_files(path: Path) -> Optional[List[str]]:
+    """Return index paths (forward slashes, like git ls-files), or None if unavailable."""
+    repo = _open(path)
+    if repo is None:
+        return None
+    try:
+        return [entry.path for entry in repo.index]
+    except (pygit2.GitError, OSError) as e:
+        # Corrupt or locked index, or an extension libgit2 cannot read.
+        logger.debug("Cannot read index in %s: %s", path, e)
+        return None
@@ -4,7 +4,10 @@ import logging
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
+
+from py_project_updater.services import git_backend
+from py_project_updater.services.git import GIT_EXECUTABLE, git_env, run_git_batch
 
 logger = logging.getLogger(__name__)
 
@@ -15,12 +18,17 @@ class GitHubCommitChecker:
     @staticmethod
     def get_last_commit_date(repo_path: Path) -> Optional[datetime]:
         """Get the last commit date for a Git repository using local operations."""
+        if git_backend.available():
+            date = git_backend.get_last_commit_date(repo_path)
+            if date is not None:
+                return date
         try:
             result = subprocess.run(
-                ["git", "log", "-1", "--format=%cI"],
+                [GIT_EXECUTABLE, "log", "-1", "--format=%cI"],
                 cwd=repo_path,
                 capture_output=True,
                 text=True,
+                env=git_env(),
             )
             if result.returncode == 0:
                 commit_date = result.stdout.strip()
@@ -29,3 +37,27 @@ class GitHubCommitChecker:
         except Exception as e:
             logger.warning(f"Error getting local commit date for {repo_path}: {str(e)}")
             return None
+
+    @classmethod
+    def get_last_commit_dates(cls, repo_paths: List[Path]) -> Dict[Path, datetime]:
+        """Get last commit dates for several repositories, querying git concurrently.
+
+        Repositories whose date could not be determined are omitted. The pygit2
+        backend is tried first when installed; git is run for the rest.
+        """
+        dates: Dict[Path, datetime] = {}
+        if git_backend.available():
+            for repo_path in repo_paths:
+                date = git_backend.get_last_commit_date(repo_path)
+                if date is not None:
+                    dates[repo_path] = date
+            # Repositories the backend could not answer for go to the CLI.
+            repo_paths = [p for p in repo_paths if p not in dates]
+        for repo_path, result in run_git_batch(repo_paths, ["log", "-1", "--format=%cI"]).items():
+            if result.returncode != 0:
+                continue
+            try:
+                dates[repo_path] = datetime.fromisoformat(result.stdout.strip())
+            except ValueError as e:
+                logger.warning(f"Error parsing commit date for {repo_path}: {str(e)}")
+        return dates
@@ -1,24 +1,43 @@
 """Pip installation in the project virtual environment."""
 
 import os
+import re
 import subprocess
+import tempfile
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 
+from py_project_updater.models import Package
 from py_project_updater.reporting import TestModeManager
 
+# pip stderr that still counts as a successful install. Matched against raw
+# bytes; stderr is only decoded when it is returned as an error.
+_PIP_BENIGN_RE = re.compile(
+    rb"already satisfied|dependency conflict|conflicting dependencies"
+    rb"|version conflict|incompatible dependencies",
+    re.IGNORECASE,
+)
+
+# Skip the PyPI self-version check and never wait on a prompt.
+_PIP_INSTALL_FLAGS = ("--no-input", "--disable-pip-version-check")
+
 
 class PipInstaller:
     """Handles pip installation in the correct virtual environment."""
 
-    def __init__(self, test_mode: TestModeManager):
+    def __init__(self, test_mode: TestModeManager, env_path: Optional[Path] = None):
         self.test_mode = test_mode
+        self._pip_paths: Dict[Path, str] = {}
+        if env_path is not None:
+            self._pip_path(env_path)
 
     def _pip_path(self, env_path: Path) -> str:
         """Return path to pip executable for the given environment."""
-        if os.name == "nt":
-            return str(env_path / "Scripts" / "pip")
-        return str(env_path / "bin" / "pip")
+        pip = self._pip_paths.get(env_path)
+        if pip is None:
+            scripts = ("Scripts", "pip") if os.name == "nt" else ("bin", "pip")
+            pip = self._pip_paths[env_path] = str(env_path.joinpath(*scripts))
+        return pip
 
     def install_requirements(
         self, requirements_file: Path, env_path: Path
@@ -35,6 +54,7 @@ class PipInstaller:
             "install",
             "-r",
             str(requirements_file),
+            *_PIP_INSTALL_FLAGS,
         ]
 
         if self.test_mode.enabled:
@@ -47,30 +67,54 @@ class PipInstaller:
             return True, None
 
         try:
-            result = subprocess.run(pip_cmd, capture_output=True, text=True)
+            result = subprocess.run(pip_cmd, capture_output=True)
 
             if result.returncode == 0:
                 return True, None
 
-            stderr = (result.stderr or "").lower()
-            if any(
-                w in stderr
-                for w in [
-                    "already satisfied",
-                    "requirement already satisfied",
-                    "dependency conflict",
-                    "conflicting dependencies",
-                    "version conflict",
-                    "incompatible dependencies",
-                ]
-            ):
+            if _PIP_BENIGN_RE.search(result.stderr or b""):
                 return True, None
 
-            return False, (result.stderr or "").strip()
+            return False, (result.stderr or b"").decode(errors="replace").strip()
 
         except Exception as e:
             return False, str(e)
 
+    def install_packages(
+        self, packages: Sequence[Package], env_path: Path
+    ) -> Tuple[bool, Optional[str]]:
+        """Install several packages with a single pip invocation.
+
+        The specifiers are written to a temporary requirements file so pip
+        starts and resolves once for the whole set.
+
+        Returns:
+            Tuple[bool, Optional[str]]: (success, error_message)
+            success is True if the packages were installed or already satisfied
+            error_message is None if successful, or contains the error message if failed
+        """
+        specs = [str(package) for package in packages]
+
+        if self.test_mode.enabled:
+            self.test_mode.log_operation(
+                True,
+                f"Would install packages: {', '.join(specs)}",
+                f"{self._pip_path(env_path)} install -r <requirements>",
+                [f"Install {package.name} in virtual environment" for package in packages],
+            )
+            return True, None
+
+        fd, tmp_name = tempfile.mkstemp(suffix=".txt", text=True)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(specs) + "\n")
+            return self.install_requirements(Path(tmp_name), env_path)
+        finally:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
     def install_package(
         self, package: str, version: Optional[str], env_path: Path
     ) -> Tuple[bool, Optional[str]]:
@@ -86,7 +130,7 @@ class PipInstaller:
         """
         pip_exe = self._pip_path(env_path)
         spec = f"{package}=={version}" if version else package
-        pip_cmd = [pip_exe, "install", spec]
+        pip_cmd = [pip_exe, "install", spec, *_PIP_INSTALL_FLAGS]
 
         if self.test_mode.enabled:
             self.test_mode.log_operation(
@@ -98,26 +142,15 @@ class PipInstaller:
             return True, None
 
         try:
-            result = subprocess.run(pip_cmd, capture_output=True, text=True)
+            result = subprocess.run(pip_cmd, capture_output=True)
 
             if result.returncode == 0:
                 return True, None
 
-            stderr = (result.stderr or "").lower()
-            if any(
-                w in stderr
-                for w in [
-                    "already satisfied",
-                    "requirement already satisfied",
-                    "dependency conflict",
-                    "conflicting dependencies",
-                    "version conflict",
-                    "incompatible dependencies",
-                ]
-            ):
+            if _PIP_BENIGN_RE.search(result.stderr or b""):
                 return True, None
 
-            return False, (result.stderr or "").strip()
+            return False, (result.stderr or b"").decode(errors="replace").strip()
 
         except Exception as e:
             return False, str(e)
@@ -1,7 +1,5 @@
 """Compare package versions between main project and subprojects."""
 
-from packaging import version as pkg_version
-
 from py_project_updater.models import Package, VersionSpecifier
 
 
@@ -10,13 +8,15 @@ class VersionComparator:
 
     @staticmethod
     def compare_versions(main_package: Package, sub_package: Package) -> bool:
-        """Compare if versions are significantly different."""
+        """Compare if versions are significantly different.
+
+        Versions that are not valid PEP 440 are never reported as different.
+        """
         if not main_package.version or not sub_package.version:
             return False
-
-        try:
-            if main_package.version.specifier == VersionSpecifier.EXACT:
-                return not sub_package.version.is_compatible_with(main_package.version.version)
-            return not main_package.version.is_compatible_with(sub_package.version.version)
-        except pkg_version.InvalidVersion:
+        if not (main_package.version.is_valid and sub_package.version.is_valid):
             return False
+
+        if main_package.version.specifier == VersionSpecifier.EXACT:
+            return not sub_package.version.is_compatible_with(main_package.version.version)
+        return not main_package.version.is_compatible_with(sub_package.version.version)
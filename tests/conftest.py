@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from py_project_updater.reporting import TestModeManager
+from py_project_updater.services import git_backend
 
 
 @pytest.fixture
@@ -13,7 +14,19 @@ def tmp_root(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def tmp_root_shared(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One directory for the whole session, for tests that never write to their root."""
+    return tmp_path_factory.mktemp("shared")
+
+
 @pytest.fixture
 def test_mode_manager() -> TestModeManager:
     """TestModeManager with test mode enabled (no real subprocess calls)."""
     return TestModeManager(enabled=True)
+
+
+@pytest.fixture
+def no_pygit2(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Force the git CLI code path even when pygit2 is installed."""
+    monkeypatch.setattr(git_backend, "pygit2", None)
@@ -0,0 +1,89 @@
+"""Tests for cli._validate_env and its cached interpreter marker."""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from py_project_updater import cli
+
+
+def _python_exe(env_path: Path) -> Path:
+    return env_path / "Scripts" / "python.exe" if os.name == "nt" else env_path / "bin" / "python"
+
+
+@pytest.fixture
+def env_path(tmp_root: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A fake virtual environment with a python executable, caching under tmp_root."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_root / "cache"))
+    env = tmp_root / "venv"
+    python_exe = _python_exe(env)
+    python_exe.parent.mkdir(parents=True)
+    python_exe.write_text("", encoding="utf-8")
+    return env
+
+
+@pytest.fixture
+def fake_run(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Record interpreter version checks instead of spawning the env's python."""
+    calls: list = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, "Python 3.11.7\n", "")
+
+    monkeypatch.setattr(cli.subprocess, "run", run)
+    return calls
+
+
+class TestValidateEnvMarker:
+    """The version check is skipped while the interpreter is unchanged."""
+
+    def test_cache_hit_spawns_no_process(self, env_path: Path, fake_run: list):
+        cli._validate_env(env_path)
+        assert len(fake_run) == 1
+
+        cli._validate_env(env_path)
+        assert len(fake_run) == 1
+
+    def test_stamp_mismatch_revalidates_and_rewrites_marker(self, env_path: Path, fake_run: list):
+        cli._validate_env(env_path)
+        marker = cli._env_marker_file(env_path)
+        old_stamp = json.loads(marker.read_text(encoding="utf-8"))["stamp"]
+
+        python_exe = _python_exe(env_path)
+        mtime_ns = python_exe.stat().st_mtime_ns + 1_000_000_000
+        os.utime(python_exe, ns=(mtime_ns, mtime_ns))
+        cli._validate_env(env_path)
+
+        assert len(fake_run) == 2
+        data = json.loads(marker.read_text(encoding="utf-8"))
+        assert data["stamp"] != old_stamp
+        assert data["version"] == "Python 3.11.7"
+
+    def test_corrupt_marker_falls_back_to_validation(self, env_path: Path, fake_run: list):
+        marker = cli._env_marker_file(env_path)
+        marker.parent.mkdir(parents=True)
+        marker.write_text("{not json", encoding="utf-8")
+
+        cli._validate_env(env_path)
+
+        assert len(fake_run) == 1
+        assert json.loads(marker.read_text(encoding="utf-8"))["version"] == "Python 3.11.7"
+
+    def test_unwritable_marker_falls_back_to_validation(self, env_path: Path, fake_run: list):
+        # A directory in the marker's place can be neither read nor written as a file.
+        cli._env_marker_file(env_path).mkdir(parents=True)
+
+        cli._validate_env(env_path)
+        cli._validate_env(env_path)
+
+        assert len(fake_run) == 2
+
+    def test_missing_interpreter_raises(self, env_path: Path, fake_run: list):
+        _python_exe(env_path).unlink()
+        with pytest.raises(ValueError, match="Python executable not found"):
+            cli._validate_env(env_path)
+        assert fake_run == []
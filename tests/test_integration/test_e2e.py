@@ -50,3 +50,51 @@ class TestSubprojectManagerE2E:
         assert any(s.name == "sub" for s in manager.test_mode.subprojects)
         # In test mode, git/pip are not run but operations are logged
         assert len(manager.test_mode.operations) >= 1
+
+    def test_batch_pip_installs_all_subprojects_in_one_call(self, tmp_root: Path):
+        """With batch_pip, requirements from every subproject go to a single pip call."""
+        for name, req in (("a", "requests>=2.0\n"), ("b", "numpy==1.26.0\n")):
+            (tmp_root / name).mkdir()
+            (tmp_root / name / "requirements.txt").write_text(req, encoding="utf-8")
+        env_path = tmp_root / "venv"
+        env_path.mkdir()
+        manager = SubprojectManager(
+            root_path=tmp_root,
+            env_path=env_path,
+            test_mode=True,
+            max_depth=2,
+            batch_pip=True,
+        )
+        manager.run()
+        ops = manager.test_mode.operations
+        pip_ops = [op.message for op in ops if op.message.startswith("Would install packages")]
+        assert len(pip_ops) == 1
+        assert "requests>=2.0" in pip_ops[0] and "numpy==1.26.0" in pip_ops[0]
+        installed = {(op.project_name, op.message) for op in ops if op.message.startswith("Installed")}
+        assert installed == {("a", "Installed requests>=2.0"), ("b", "Installed numpy==1.26.0")}
+
+    def test_batch_pip_installs_conflicting_pins_separately(self, tmp_root: Path, caplog):
+        """A subproject pinning a different version than the merged set is installed on its own."""
+        for name, req in (("a", "requests==2.28.0\n"), ("b", "requests==2.31.0\n")):
+            (tmp_root / name).mkdir()
+            (tmp_root / name / "requirements.txt").write_text(req, encoding="utf-8")
+        env_path = tmp_root / "venv"
+        env_path.mkdir()
+        manager = SubprojectManager(
+            root_path=tmp_root,
+            env_path=env_path,
+            test_mode=True,
+            max_depth=2,
+            batch_pip=True,
+        )
+        with caplog.at_level("WARNING", logger="py_project_updater.orchestration"):
+            manager.run()
+        ops = manager.test_mode.operations
+        pip_ops = sorted(op.message for op in ops if op.message.startswith("Would install packages"))
+        assert pip_ops == [
+            "Would install packages: requests==2.28.0",
+            "Would install packages: requests==2.31.0",
+        ]
+        installed = {(op.project_name, op.message) for op in ops if op.message.startswith("Installed")}
+        assert installed == {("a", "Installed requests==2.28.0"), ("b", "Installed requests==2.31.0")}
+        assert any("installing" in r.getMessage() and "separately" in r.getMessage() for r in caplog.records)
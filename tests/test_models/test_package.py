@@ -1,6 +1,7 @@
 """Tests for Package model and Package.from_string."""
 
 import pytest
+from packaging.requirements import Requirement
 
 from py_project_updater.models.package import Package
 from py_project_updater.models.version import Version, VersionSpecifier
@@ -38,6 +39,15 @@ class TestPackageFromString:
         assert pkg.version.specifier == VersionSpecifier.LESS_EQUAL
         assert pkg.version.version == "1.0.0"
 
+    def test_greater_and_less_versions(self):
+        gt = Package.from_string("numpy>1.20")
+        assert gt.name == "numpy"
+        assert gt.version.specifier == VersionSpecifier.GREATER
+        assert gt.version.version == "1.20"
+        lt = Package.from_string("numpy<2")
+        assert lt.version.specifier == VersionSpecifier.LESS
+        assert lt.version.version == "2"
+
     def test_compatible_version(self):
         pkg = Package.from_string("pkg~=2.1.0")
         assert pkg.name == "pkg"
@@ -67,6 +77,39 @@ class TestPackageFromString:
 class TestPackageEdgeCases:
     """Edge cases and lines that have no specifier."""
 
+    def test_extras_kept_in_name(self):
+        pkg = Package.from_string("foo[ssl,socks]>=1.0")
+        assert pkg.name == "foo[socks,ssl]"
+        assert pkg.version.specifier == VersionSpecifier.GREATER_EQUAL
+        assert pkg.version.version == "1.0"
+
+    def test_environment_marker_round_trips(self):
+        pkg = Package.from_string('pywin32; sys_platform == "win32"')
+        assert pkg.name == "pywin32"
+        assert pkg.version is None
+        assert str(pkg) == 'pywin32; sys_platform == "win32"'
+
+    def test_environment_marker_not_parsed_as_specifier(self):
+        pkg = Package.from_string('pkg>=1.0; python_version < "3.10"')
+        assert pkg.name == "pkg"
+        assert pkg.version.specifier == VersionSpecifier.GREATER_EQUAL
+        assert pkg.version.version == "1.0"
+        assert str(pkg) == 'pkg>=1.0; python_version < "3.10"'
+
+    def test_url_requirement_round_trips(self):
+        pkg = Package.from_string("pkg @ https://example.com/pkg-1.0.whl")
+        assert pkg.name == "pkg"
+        assert pkg.version is None
+        assert str(pkg) == "pkg @ https://example.com/pkg-1.0.whl"
+
+    def test_multiple_specifiers_round_trip(self):
+        pkg = Package.from_string("pandas<2.0,>=1.0")
+        assert pkg.name == "pandas"
+        # The lower bound is the clause used for version comparisons.
+        assert pkg.version.specifier == VersionSpecifier.GREATER_EQUAL
+        assert pkg.version.version == "1.0"
+        assert str(pkg) == "pandas<2.0,>=1.0"
+
     def test_empty_like_name_with_no_specifier(self):
         # Line with no known specifiers is treated as name only
         pkg = Package.from_string("some-package-name")
@@ -79,3 +122,26 @@ class TestPackageEdgeCases:
         assert pkg.name == "pkg"
         assert pkg.version is not None
         assert pkg.version.version == "1.0  # comment"
+
+
+class TestPackageParsePaths:
+    """The regex fast path and the packaging Requirement path agree."""
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            "requests",
+            "requests==2.28.0",
+            "numpy>=1.20",
+            "numpy<2",
+            "pkg~=2.1.0",
+            "foo!=1.0.0",
+            "Django==4.*",
+            "zope.interface>=5.0",
+        ],
+    )
+    def test_fast_path_matches_requirement_path(self, spec: str):
+        fast = Package.from_string(spec)
+        slow = Package._from_requirement(Requirement(spec))
+        assert str(fast) == str(slow) == spec
+        assert fast == slow
@@ -26,6 +26,12 @@ class TestVersion:
         v = Version(VersionSpecifier.GREATER_EQUAL, "2.0.0")
         assert str(v) == ">=2.0.0"
 
+    def test_equality_and_repr_ignore_cached_parse(self):
+        a = Version(VersionSpecifier.EXACT, "1.2.3")
+        b = Version(VersionSpecifier.EXACT, "1.2.3")
+        assert a == b
+        assert "_parsed" not in repr(a)
+
     def test_exact_same_version_compatible(self):
         v = Version(VersionSpecifier.EXACT, "1.2.3")
         assert v.is_compatible_with("1.2.3") is True
@@ -84,3 +90,7 @@ class TestVersion:
     def test_invalid_self_version_returns_false(self):
         v = Version(VersionSpecifier.EXACT, "not.a.version")
         assert v.is_compatible_with("1.2.3") is False
+
+    def test_is_valid_reflects_pep440_parse(self):
+        assert Version(VersionSpecifier.EXACT, "1.2.3").is_valid is True
+        assert Version(VersionSpecifier.EXACT, "not.a.version").is_valid is False
@@ -0,0 +1,112 @@
+"""Tests for TestModeManager logging and summary formatting."""
+
+from pathlib import Path
+
+from py_project_updater.models import OpKind, Package, SubprojectInfo
+from py_project_updater.reporting import TestModeManager
+
+
+def _manager(root: Path, *names: str) -> TestModeManager:
+    subprojects = [SubprojectInfo(root / n, None, n, parent_path=root) for n in names]
+    return TestModeManager(enabled=True, subprojects=subprojects, root_path=root)
+
+
+class TestLogOperation:
+    """Tests for log_operation bookkeeping."""
+
+    def test_records_operation(self):
+        tm = TestModeManager(enabled=True)
+        tm.log_operation(True, "Installed requests==2.28.0", command="pip", project_name="a")
+        assert len(tm.operations) == 1
+        op = tm.operations[0]
+        assert op.success is True
+        assert op.command == "pip"
+        assert op.project_name == "a"
+        assert op.changes == []
+
+    def test_classifies_message_keywords_once(self):
+        tm = TestModeManager(enabled=False)
+        tm.log_operation(True, "Installed requests==2.28.0", project_name="a")
+        tm.log_operation(True, "Warning: git pull skipped, status unknown", project_name="a")
+        tm.log_operation(True, "Installed numpy>=1.20", project_name="a")
+        install, mixed, ranged = tm.operations
+        assert install.kind == OpKind.INSTALL
+        assert (install.package_name, install.package_version) == ("requests", "2.28.0")
+        assert mixed.kind == OpKind.WARNING | OpKind.PULL | OpKind.STATUS
+        assert mixed.package_name is None
+        assert (ranged.package_name, ranged.package_version) == ("numpy>=1.20", "any")
+
+    def test_log_installed_matches_parsed_install_message(self):
+        tm = TestModeManager(enabled=False)
+        for spec in ("requests==2.28.0", "numpy>=1.20", "pull-tool"):
+            tm.log_operation(True, f"Installed {spec}", project_name="a")
+            tm.log_installed("a", Package.from_string(spec))
+        parsed, direct = tm.operations[0::2], tm.operations[1::2]
+        for p, d in zip(parsed, direct):
+            assert (d.message, d.package_name, d.package_version) == (
+                p.message,
+                p.package_name,
+                p.package_version,
+            )
+            assert d.kind == OpKind.INSTALL
+
+
+class TestGetSummary:
+    """Tests for get_summary grouping, sorting and conflict detection."""
+
+    def test_groups_projects_by_outcome(self, tmp_root: Path):
+        tm = _manager(tmp_root, "ok", "bad", "warn")
+        tm.log_operation(True, "Git status: Repository is clean", project_name="ok")
+        tm.log_operation(True, "Would pull changes", project_name="ok")
+        tm.log_operation(True, "Installed requests==2.28.0", project_name="ok")
+        tm.log_operation(False, "Git update failed: boom", project_name="bad")
+        tm.log_operation(True, "Warning: something odd", project_name="warn")
+
+        summary = tm.get_summary()
+        errors = summary.index("Projects with errors:")
+        warnings = summary.index("Projects with warnings:")
+        successes = summary.index("Successful projects:")
+        assert errors < warnings < successes
+        assert "Git update failed: boom" in summary[errors:warnings]
+        assert "Warning: something odd" in summary[warnings:successes]
+        ok_row = next(line for line in summary.splitlines() if line.strip().startswith("ok "))
+        assert "Repository is clean" in ok_row
+        assert "(pull)" in ok_row
+        assert " 1 " in ok_row
+
+    def test_no_operations(self, tmp_root: Path):
+        tm = _manager(tmp_root, "a")
+        assert tm.get_summary() == "\nTest Mode Summary:\n(no operations)"
+        assert tm._analyze_package_conflicts() == ({}, {})
+
+    def test_skips_main_project(self, tmp_root: Path):
+        tm = TestModeManager(
+            enabled=True,
+            subprojects=[SubprojectInfo(tmp_root, None, "main")],
+            root_path=tmp_root,
+        )
+        tm.log_operation(True, "Git status: Repository is clean", project_name="main")
+        summary = tm.get_summary()
+        assert "Successful projects:" not in summary
+        assert "main" not in summary
+
+    def test_sorts_successful_projects_by_git_status(self, tmp_root: Path):
+        tm = _manager(tmp_root, "a_dirty", "b_clean")
+        tm.log_operation(
+            True, "Git status: Repository has uncommitted changes", project_name="a_dirty"
+        )
+        tm.log_operation(True, "Git status: Repository is clean", project_name="b_clean")
+        summary = tm.get_summary()
+        assert summary.index("b_clean") < summary.index("a_dirty")
+
+    def test_reports_conflicts_and_unique_packages(self, tmp_root: Path):
+        tm = _manager(tmp_root, "a", "b")
+        tm.log_operation(True, "Installed requests==2.28.0", project_name="a")
+        tm.log_operation(True, "Installed requests==2.31.0", project_name="b")
+        tm.log_operation(True, "Installed numpy==1.24.0", project_name="a")
+        summary = tm.get_summary()
+        assert "Package version conflicts:" in summary
+        assert "a:2.28.0" in summary and "b:2.31.0" in summary
+        unique = summary[summary.index("Unique package installations:"):]
+        assert "numpy" in unique
+        assert "requests" not in unique
@@ -86,3 +86,47 @@ class TestSubprojectFinder:
         assert "numpy" in result[0].requirements
         assert result[0].requirements["numpy"].version is not None
         assert result[0].requirements["numpy"].version.version == "1.24.0"
+
+    def test_includes_root_with_requirements(self, tmp_root: Path):
+        (tmp_root / "requirements.txt").write_text("x\n", encoding="utf-8")
+        sub = tmp_root / "sub"
+        sub.mkdir()
+        (sub / ".git").mkdir()
+        result = SubprojectFinder.find_subprojects(tmp_root, max_depth=2)
+        by_path = {s.path: s for s in result}
+        assert set(by_path) == {tmp_root, sub}
+        assert by_path[tmp_root].depth == 0
+        assert by_path[sub].requirements_file is None
+
+    def test_nested_subproject_records_closest_parent(self, tmp_root: Path):
+        outer = tmp_root / "outer"
+        inner = outer / "mid" / "inner"
+        inner.mkdir(parents=True)
+        (outer / ".git").mkdir()
+        (inner / "requirements.txt").write_text("x\n", encoding="utf-8")
+        result = {s.name: s for s in SubprojectFinder.find_subprojects(tmp_root, max_depth=3)}
+        assert result["outer"].is_nested is False
+        assert result["inner"].is_nested is True
+        assert result["inner"].parent_path == outer
+
+    def test_ignored_directories_are_not_descended(self, tmp_root: Path):
+        venv = tmp_root / "venv"
+        (venv / "lib" / "pkg").mkdir(parents=True)
+        (venv / "lib" / "pkg" / "requirements.txt").write_text("x\n", encoding="utf-8")
+        (tmp_root / "app").mkdir()
+        (tmp_root / "app" / "requirements.txt").write_text("y\n", encoding="utf-8")
+        result = SubprojectFinder.find_subprojects(tmp_root, max_depth=3, ignored={"venv"})
+        assert [s.name for s in result] == ["app"]
+
+    def test_compute_nesting_uses_closest_candidate(self, tmp_root: Path):
+        a, b, c = tmp_root / "a", tmp_root / "a" / "x" / "b", tmp_root / "a" / "x" / "b" / "c"
+        nesting = SubprojectFinder._compute_nesting({tmp_root, a, b, c}, tmp_root)
+        assert nesting[a] == (None, False)
+        assert nesting[b] == (a, True)
+        assert nesting[c] == (b, True)
+
+    def test_root_under_hidden_directory_is_searched(self, tmp_root: Path):
+        root = tmp_root / ".work" / "root"
+        (root / "app").mkdir(parents=True)
+        (root / "app" / "requirements.txt").write_text("x\n", encoding="utf-8")
+        assert [s.name for s in SubprojectFinder.find_subprojects(root, max_depth=2)] == ["app"]
@@ -1,75 +1,217 @@
 """Tests for GitManager (with test mode and mocked subprocess)."""
 
+import io
+import os
+import subprocess
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from py_project_updater.reporting import TestModeManager
+from py_project_updater.services import git as git_mod
 from py_project_updater.services.git import GitManager
 
 
+def _completed(returncode: int = 0, stdout="", stderr="") -> subprocess.CompletedProcess:
+    """A subprocess.run result with the given exit code and output."""
+    return subprocess.CompletedProcess([], returncode, stdout, stderr)
+
+
+def _fake_popen(stdout: str, returncode: int = 0) -> MagicMock:
+    """A Popen stand-in that streams NUL-separated stdout and exits with returncode."""
+    proc = MagicMock()
+    proc.__enter__.return_value = proc
+    proc.stdout = io.BytesIO(stdout.replace("\n", "\0").encode())
+    proc.wait.return_value = returncode
+    return proc
+
+
 class TestGitManagerTestMode:
     """Tests when test mode is enabled (no real subprocess calls)."""
 
-    def test_is_git_repo_returns_true_in_test_mode(self, tmp_root: Path, test_mode_manager: TestModeManager):
+    def test_is_git_repo_returns_true_in_test_mode(self, tmp_root_shared: Path, test_mode_manager: TestModeManager):
         gm = GitManager(test_mode=test_mode_manager)
-        assert gm.is_git_repo(tmp_root) is True
+        assert gm.is_git_repo(tmp_root_shared) is True
         assert len(test_mode_manager.operations) == 1
         assert "rev-parse" in (test_mode_manager.operations[0].command or "")
 
-    def test_get_remote_url_returns_fake_in_test_mode(self, tmp_root: Path, test_mode_manager: TestModeManager):
+    def test_get_remote_url_returns_fake_in_test_mode(self, tmp_root_shared: Path, test_mode_manager: TestModeManager):
         gm = GitManager(test_mode=test_mode_manager)
-        url = gm.get_remote_url(tmp_root)
-        assert url is not None
-        assert "github.com" in url
-        assert url.endswith(".git")
+        url = gm.get_remote_url(tmp_root_shared)
+        assert url == f"https://github.com/test/{tmp_root_shared.name}.git"
         assert len(test_mode_manager.operations) == 1
         assert "remote get-url" in (test_mode_manager.operations[0].command or "")
 
 
+@pytest.mark.usefixtures("no_pygit2")
 class TestGitManagerWithMockedSubprocess:
     """Tests with subprocess.run mocked for non-test-mode paths."""
 
-    def test_is_git_repo_true_when_git_says_true(self, tmp_root: Path):
+    def test_is_git_repo_true_for_git_dir_without_running_git(self, tmp_root: Path):
         test_mode = TestModeManager(enabled=False)
         gm = GitManager(test_mode=test_mode)
-        with patch("py_project_updater.services.git.subprocess.run") as run:
-            run.return_value = type("R", (), {"returncode": 0, "stdout": "true", "stderr": ""})()
+        (tmp_root / ".git").mkdir()
+        (tmp_root / ".git" / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+        with patch.object(git_mod.subprocess, "run") as run:
             assert gm.is_git_repo(tmp_root) is True
-            run.assert_called_once()
-            assert "rev-parse" in run.call_args[0][0]
+            run.assert_not_called()
 
-    def test_is_git_repo_false_when_git_says_false(self, tmp_root: Path):
-        test_mode = TestModeManager(enabled=False)
-        gm = GitManager(test_mode=test_mode)
-        with patch("py_project_updater.services.git.subprocess.run") as run:
-            run.return_value = type("R", (), {"returncode": 1, "stdout": "", "stderr": ""})()
-            assert gm.is_git_repo(tmp_root) is False
+    def test_is_git_repo_true_for_gitfile(self, tmp_root: Path):
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+        (tmp_root / ".git").write_text("gitdir: ../.git/modules/sub\n", encoding="utf-8")
+        assert gm.is_git_repo(tmp_root) is True
+
+    def test_is_git_repos_false_without_own_git(self, tmp_root: Path):
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+        repo, plain = tmp_root / "repo", tmp_root / "repo" / "plain"
+        (repo / ".git").mkdir(parents=True)
+        (repo / ".git" / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+        plain.mkdir()
+        assert gm.is_git_repos([repo, plain]) == {repo: True, plain: False}
 
     def test_get_remote_url_returns_https_converted_from_ssh(self, tmp_root: Path):
         test_mode = TestModeManager(enabled=False)
         gm = GitManager(test_mode=test_mode)
-        with patch("py_project_updater.services.git.subprocess.run") as run:
-            run.return_value = type(
-                "R", (), {"returncode": 0, "stdout": "git@github.com:user/repo.git\n", "stderr": ""}
-            )()
+        with patch.object(git_mod.subprocess, "run") as run:
+            run.return_value = _completed(stdout="git@github.com:user/repo.git\n")
             url = gm.get_remote_url(tmp_root)
             assert url == "https://github.com/user/repo.git"
 
     def test_get_remote_url_returns_none_on_failure(self, tmp_root: Path):
         test_mode = TestModeManager(enabled=False)
         gm = GitManager(test_mode=test_mode)
-        with patch("py_project_updater.services.git.subprocess.run") as run:
-            run.return_value = type("R", (), {"returncode": 1, "stdout": "", "stderr": "error"})()
+        with patch.object(git_mod.subprocess, "run") as run:
+            run.return_value = _completed(1, stderr="error")
             assert gm.get_remote_url(tmp_root) is None
 
+    def test_git_status_reads_ahead_count_from_porcelain_v2(self, tmp_root: Path):
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+        stdout = "# branch.oid abc\n# branch.head main\n# branch.ab +2 -0\n? build/\n"
+        with patch.object(git_mod.subprocess, "Popen") as popen:
+            popen.return_value = _fake_popen(stdout)
+            assert gm.get_git_status(tmp_root) == (False, "Repository has unpushed commits", True)
+            assert popen.call_count == 1
+
+    def test_git_status_handles_renames_and_spaces(self, tmp_root: Path):
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+        stdout = "2 RM N... 100644 100644 100644 a1 a1 R100 build/new name.o\nsrc/old name.py\n? x y.pyc\n"
+        with patch.object(git_mod.subprocess, "Popen", return_value=_fake_popen(stdout)):
+            assert gm.get_git_status(tmp_root) == (True, "Repository is clean", True)
+
+    def test_git_status_stops_git_at_first_relevant_change(self, tmp_root: Path):
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+        proc = _fake_popen("? a.pyc\n1 .M N... 100644 100644 100644 a1 a1 a.py\n? b.txt\n")
+        with patch.object(git_mod.subprocess, "Popen", return_value=proc):
+            assert gm.get_git_status(tmp_root) == (False, "Repository has uncommitted changes", True)
+        proc.terminate.assert_called_once()
+
+    def test_modified_tracked_binary_is_a_relevant_change_and_not_reverted(self, tmp_root: Path):
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+        stdout = "1 .M N... 100644 100644 100644 a1 a1 lib/native.so\n? build/\n"
+        with patch.object(git_mod.subprocess, "Popen", return_value=_fake_popen(stdout)), patch.object(
+            git_mod.subprocess, "run", return_value=_completed()
+        ) as run:
+            assert gm.get_git_status(tmp_root) == (False, "Repository has uncommitted changes", False)
+            assert gm.update_repository(tmp_root) == (True, "Fetched changes (repository not clean)")
+        commands = [call.args[0] for call in run.call_args_list]
+        assert len(commands) == 1 and "fetch" in commands[0]
+
+    def test_git_status_is_memoized_until_fetch(self, tmp_root: Path):
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+        dirty = (False, "Repository has uncommitted changes", False)
+        stdout = "1 .M N... 100644 100644 100644 a1 a1 a.py\n"
+        with patch.object(git_mod.subprocess, "Popen") as popen, patch.object(git_mod.subprocess, "run") as run:
+            popen.side_effect = lambda *a, **k: _fake_popen(stdout)
+            run.return_value = _completed()
+            assert gm.get_git_status(tmp_root) == dirty
+            assert gm.get_git_status(tmp_root) == dirty
+            assert popen.call_count == 1
+
+            assert gm.update_repository(tmp_root) == (True, "Fetched changes (repository not clean)")
+            assert run.call_count == 1
+            assert gm.get_git_status(tmp_root) == dirty
+            assert popen.call_count == 2
+
 
 class TestGitManagerIgnorePatterns:
     """Tests for PYTHON_IGNORE_PATTERNS."""
 
     def test_ignore_patterns_defined(self):
-        assert hasattr(GitManager, "PYTHON_IGNORE_PATTERNS")
         patterns = GitManager.PYTHON_IGNORE_PATTERNS
         assert "__pycache__/" in patterns
         assert "*.pyc" in patterns
+
+    @pytest.mark.parametrize(
+        "line, ignored",
+        [
+            ("?? foo.pyc", True),
+            ("?? pkg/__pycache__/", True),
+            ("?? build/", True),
+            ("?? dist/x.whl", True),
+            ("?? x.egg-info/", True),
+            (" M src/a.py", False),
+            ("D  a.pyc", False),
+            (" M lib/native.so", False),
+            ("M  pkg.egg", False),
+            ("A  ext.pyd", False),
+            ("?? lib/native.so", True),
+        ],
+    )
+    def test_is_ignored_change(self, line: str, ignored: bool):
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+        assert gm._is_ignored_change(line) is ignored
+
+    def test_find_artifacts_skips_tracked_and_git_dir(self, tmp_root: Path):
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+        (tmp_root / ".git").mkdir()
+        (tmp_root / ".git" / "hook.pyc").write_text("", encoding="utf-8")
+        (tmp_root / "pkg" / "__pycache__").mkdir(parents=True)
+        (tmp_root / "pkg" / "mod.pyc").write_text("", encoding="utf-8")
+        (tmp_root / "pkg" / "keep.pyc").write_text("", encoding="utf-8")
+        (tmp_root / "build").mkdir()
+        (tmp_root / "build" / "tracked.txt").write_text("", encoding="utf-8")
+
+        dirs, files = gm._find_artifacts(
+            tmp_root,
+            tracked_files={"pkg/keep.pyc", "build/tracked.txt"},
+            tracked_dirs={"pkg", "build"},
+        )
+        assert dirs == [str(tmp_root / "pkg" / "__pycache__")]
+        assert files == [str(tmp_root / "pkg" / "mod.pyc")]
+
+    def test_clean_python_artifacts_removes_untracked_artifacts(self, tmp_root: Path):
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+        (tmp_root / "pkg" / "__pycache__").mkdir(parents=True)
+        (tmp_root / "pkg" / "__pycache__" / "mod.cpython-311.pyc").write_text("", encoding="utf-8")
+        (tmp_root / "pkg" / "mod.pyc").write_text("", encoding="utf-8")
+        (tmp_root / "pkg" / "mod.py").write_text("", encoding="utf-8")
+        with patch.object(git_mod.subprocess, "run"), patch.object(
+            gm, "_list_tracked_files", return_value=frozenset({"pkg/mod.py"})
+        ):
+            gm._clean_python_artifacts(tmp_root)
+        assert sorted(p.name for p in (tmp_root / "pkg").iterdir()) == ["mod.py"]
+
+
+@pytest.mark.usefixtures("no_pygit2")
+class TestTrackedFilesCache:
+    """Tests for the on-disk git ls-files cache."""
+
+    def test_reuses_listing_until_index_changes(self, tmp_root: Path, monkeypatch):
+        monkeypatch.setattr(git_mod, "TRACKED_FILES_CACHE_DIR", tmp_root / "cache")
+        repo = tmp_root / "repo"
+        (repo / ".git").mkdir(parents=True)
+        index = repo / ".git" / "index"
+        index.write_bytes(b"")
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+
+        with patch.object(git_mod.subprocess, "run") as run:
+            run.return_value = _completed(stdout=b"a.py\0sub/b.py\0", stderr=b"")
+            assert gm._list_tracked_files(repo) == {"a.py", "sub/b.py"}
+            assert gm._list_tracked_files(repo) == {"a.py", "sub/b.py"}
+            assert run.call_count == 1
+
+            os.utime(index, ns=(0, index.stat().st_mtime_ns + 1_000_000))
+            run.return_value = _completed(stdout=b"a.py\0", stderr=b"")
+            assert gm._list_tracked_files(repo) == {"a.py"}
+            assert run.call_count == 2
@@ -0,0 +1,136 @@
+"""Tests for the optional pygit2 backend (stubbed, and real when pygit2 is installed)."""
+
+import os
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from py_project_updater.reporting import TestModeManager
+from py_project_updater.services import git as git_mod
+from py_project_updater.services import git_backend
+from py_project_updater.services import github_commit
+from py_project_updater.services.git import GitManager
+from py_project_updater.services.github_commit import GitHubCommitChecker
+
+
+class _GitError(Exception):
+    pass
+
+
+class _FailingIndex:
+    def __iter__(self):
+        raise _GitError("unsupported index extension")
+
+
+def _stub_pygit2(repository) -> SimpleNamespace:
+    """A pygit2 stand-in whose Repository() returns the given object."""
+    return SimpleNamespace(GitError=_GitError, Commit=object, Repository=lambda path: repository)
+
+
+class TestGitBackendStubbed:
+    """Tests with pygit2 replaced by a stub module."""
+
+    def test_unavailable_backend_returns_none(self, no_pygit2, tmp_root: Path):
+        assert git_backend.available() is False
+        assert git_backend.get_remote_url(tmp_root) is None
+        assert git_backend.get_last_commit_date(tmp_root) is None
+        assert git_backend.list_tracked_files(tmp_root) is None
+
+    def test_list_tracked_files_reads_index_paths(self, monkeypatch, tmp_root: Path):
+        repo = SimpleNamespace(index=[SimpleNamespace(path="a.py"), SimpleNamespace(path="sub/b.py")])
+        monkeypatch.setattr(git_backend, "pygit2", _stub_pygit2(repo))
+        assert git_backend.list_tracked_files(tmp_root) == ["a.py", "sub/b.py"]
+
+    def test_list_tracked_files_returns_none_on_unreadable_index(self, monkeypatch, tmp_root: Path):
+        monkeypatch.setattr(git_backend, "pygit2", _stub_pygit2(SimpleNamespace(index=_FailingIndex())))
+        assert git_backend.list_tracked_files(tmp_root) is None
+
+    def test_get_remote_url_returns_none_for_missing_remote(self, monkeypatch, tmp_root: Path):
+        repo = SimpleNamespace(remotes={"origin": SimpleNamespace(url="https://github.com/u/r.git")})
+        monkeypatch.setattr(git_backend, "pygit2", _stub_pygit2(repo))
+        assert git_backend.get_remote_url(tmp_root) == "https://github.com/u/r.git"
+        assert git_backend.get_remote_url(tmp_root, "upstream") is None
+
+
+class TestGitBackendFallback:
+    """Callers use the git CLI for repositories the backend cannot answer for."""
+
+    @pytest.fixture(autouse=True)
+    def _backend_enabled(self, monkeypatch):
+        monkeypatch.setattr(git_backend, "available", lambda: True)
+
+    def test_remote_url_falls_back_to_cli_when_backend_returns_none(self, monkeypatch, tmp_root: Path):
+        good, bad = tmp_root / "good", tmp_root / "bad"
+        urls = {good: "https://github.com/u/good.git", bad: None}
+        monkeypatch.setattr(git_backend, "get_remote_url", lambda path: urls[path])
+        gm = GitManager(test_mode=TestModeManager(enabled=False))
+        with patch.object(git_mod.subprocess, "run") as run:
+            run.return_value = subprocess.CompletedProcess([], 0, "git@github.com:u/bad.git\n", "")
+            assert gm.get_remote_urls([good, bad]) == {
+                good: "https://github.com/u/good.git",
+                bad: "https://github.com/u/bad.git",
+            }
+            assert run.call_count == 1
+            assert run.call_args.kwargs["cwd"] == bad
+
+    def test_last_commit_date_falls_back_to_cli_when_backend_returns_none(self, monkeypatch, tmp_root: Path):
+        monkeypatch.setattr(git_backend, "get_last_commit_date", lambda path: None)
+        with patch.object(github_commit.subprocess, "run") as run:
+            run.return_value = subprocess.CompletedProcess([], 0, "2024-01-02T03:04:05+00:00\n", "")
+            assert GitHubCommitChecker.get_last_commit_date(tmp_root) == datetime(
+                2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc
+            )
+            assert run.call_count == 1
+
+    def test_last_commit_dates_fall_back_to_cli_for_unanswered_repos(self, monkeypatch, tmp_root: Path):
+        good, bad = tmp_root / "good", tmp_root / "bad"
+        backend_date = datetime(2023, 5, 6, tzinfo=timezone.utc)
+        monkeypatch.setattr(
+            git_backend, "get_last_commit_date", lambda path: backend_date if path == good else None
+        )
+        with patch.object(git_mod.subprocess, "run") as run:
+            run.return_value = subprocess.CompletedProcess([], 0, "2024-01-02T03:04:05+00:00\n", "")
+            assert GitHubCommitChecker.get_last_commit_dates([good, bad]) == {
+                good: backend_date,
+                bad: datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            }
+            assert run.call_count == 1
+            assert run.call_args.kwargs["cwd"] == bad
+
+
+class TestGitBackendReal:
+    """Tests against a real repository; skipped unless pygit2 and git are installed."""
+
+    @pytest.fixture
+    def repo(self, tmp_root: Path) -> Path:
+        pytest.importorskip("pygit2")
+        env = {**os.environ, "GIT_CONFIG_GLOBAL": os.devnull, "GIT_CONFIG_NOSYSTEM": "1"}
+
+        def git(*args: str) -> None:
+            subprocess.run(["git", *args], cwd=tmp_root, check=True, capture_output=True, env=env)
+
+        try:
+            git("init", "-q")
+        except (OSError, subprocess.CalledProcessError):
+            pytest.skip("git is not available")
+        (tmp_root / "sub").mkdir()
+        (tmp_root / "a.py").write_text("", encoding="utf-8")
+        (tmp_root / "sub" / "b.py").write_text("", encoding="utf-8")
+        git("add", ".")
+        git("-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "init")
+        git("remote", "add", "origin", "https://github.com/user/repo.git")
+        return tmp_root
+
+    def test_queries_match_git_cli(self, repo: Path):
+        assert git_backend.available() is True
+        assert sorted(git_backend.list_tracked_files(repo)) == ["a.py", "sub/b.py"]
+        assert git_backend.get_remote_url(repo) == "https://github.com/user/repo.git"
+        assert git_backend.get_last_commit_date(repo) is not None
+
+    def test_non_repository_returns_none(self, tmp_root: Path):
+        pytest.importorskip("pygit2")
+        assert git_backend.list_tracked_files(tmp_root / "missing") is None
@@ -1,27 +1,33 @@
 """Tests for PipInstaller (test mode and mocked subprocess)."""
 
 import os
+import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from py_project_updater.models import Package
 from py_project_updater.reporting import TestModeManager
 from py_project_updater.services.pip_installer import PipInstaller
 
 
+def _completed(returncode: int = 0, stderr: bytes = b"") -> subprocess.CompletedProcess:
+    """A subprocess.run result as pip returns it (bytes output)."""
+    return subprocess.CompletedProcess([], returncode, b"", stderr)
+
+
 class TestPipInstallerTestMode:
     """Tests when test mode is enabled (no real pip calls)."""
 
     def test_install_requirements_succeeds_in_test_mode(
-        self, tmp_root: Path, test_mode_manager: TestModeManager
+        self, tmp_root_shared: Path, test_mode_manager: TestModeManager
     ):
-        req_file = tmp_root / "requirements.txt"
-        req_file.write_text("requests==2.28.0\n", encoding="utf-8")
-        env_path = tmp_root / "venv"
-        env_path.mkdir()
-
+        # Test mode only records the command; neither path is touched.
         installer = PipInstaller(test_mode=test_mode_manager)
-        success, err = installer.install_requirements(req_file, env_path)
+        success, err = installer.install_requirements(
+            tmp_root_shared / "requirements.txt", tmp_root_shared / "venv"
+        )
         assert success is True
         assert err is None
         assert len(test_mode_manager.operations) == 1
@@ -29,28 +35,80 @@ class TestPipInstallerTestMode:
         assert "requirements" in (test_mode_manager.operations[0].message or "").lower()
 
     def test_install_package_succeeds_in_test_mode(
-        self, tmp_root: Path, test_mode_manager: TestModeManager
+        self, tmp_root_shared: Path, test_mode_manager: TestModeManager
     ):
-        env_path = tmp_root / "venv"
-        env_path.mkdir()
-
         installer = PipInstaller(test_mode=test_mode_manager)
-        success, err = installer.install_package("requests", "2.28.0", env_path)
+        success, err = installer.install_package("requests", "2.28.0", tmp_root_shared / "venv")
         assert success is True
         assert err is None
         assert len(test_mode_manager.operations) == 1
         assert "2.28.0" in (test_mode_manager.operations[0].message or "")
 
+    def test_install_packages_logs_single_operation_in_test_mode(
+        self, tmp_root_shared: Path, test_mode_manager: TestModeManager
+    ):
+        installer = PipInstaller(test_mode=test_mode_manager)
+        packages = [Package.from_string("requests==2.28.0"), Package.from_string("numpy")]
+        success, err = installer.install_packages(packages, tmp_root_shared / "venv")
+        assert (success, err) == (True, None)
+        assert len(test_mode_manager.operations) == 1
+        assert "requests==2.28.0, numpy" in test_mode_manager.operations[0].message
+
+
+class TestPipInstallerBatch:
+    """Tests for install_packages with a mocked pip."""
+
+    def test_install_packages_runs_pip_once_with_requirements_file(self, tmp_root: Path):
+        installer = PipInstaller(test_mode=TestModeManager(enabled=False))
+        packages = [Package.from_string("requests>=2.0"), Package.from_string("numpy==1.26.0")]
+        seen = {}
+
+        def fake_run(cmd, **kwargs):
+            seen["cmd"] = cmd
+            seen["file"] = Path(cmd[cmd.index("-r") + 1])
+            seen["lines"] = seen["file"].read_text(encoding="utf-8").splitlines()
+            return _completed()
+
+        with patch("py_project_updater.services.pip_installer.subprocess.run", side_effect=fake_run) as run:
+            assert installer.install_packages(packages, tmp_root / "venv") == (True, None)
+        assert run.call_count == 1
+        assert seen["cmd"][1:3] == ["install", "-r"]
+        assert seen["lines"] == ["requests>=2.0", "numpy==1.26.0"]
+        assert "--disable-pip-version-check" in seen["cmd"]
+        assert not seen["file"].exists()
+
+    @pytest.mark.parametrize(
+        "stderr, expected",
+        [
+            (b"Requirement ALREADY SATISFIED: requests", (True, None)),
+            (b"ERROR: pip's resolver found a Version Conflict", (True, None)),
+            (b"ERROR: No matching distribution found\n", (False, "ERROR: No matching distribution found")),
+        ],
+    )
+    def test_install_package_treats_benign_stderr_as_success(self, tmp_root_shared: Path, stderr, expected):
+        installer = PipInstaller(test_mode=TestModeManager(enabled=False))
+        with patch("py_project_updater.services.pip_installer.subprocess.run") as run:
+            run.return_value = _completed(1, stderr)
+            assert installer.install_package("requests", None, tmp_root_shared / "venv") == expected
+
 
 class TestPipInstallerPipPath:
     """Tests for _pip_path behaviour."""
 
-    def test_pip_path_contains_scripts_or_bin_and_pip(self):
+    @pytest.mark.parametrize(
+        "scripts_dir",
+        [
+            pytest.param("Scripts", marks=pytest.mark.skipif(os.name != "nt", reason="Windows layout")),
+            pytest.param("bin", marks=pytest.mark.skipif(os.name == "nt", reason="POSIX layout")),
+        ],
+    )
+    def test_pip_path_contains_scripts_or_bin_and_pip(self, scripts_dir: str):
         installer = PipInstaller(test_mode=TestModeManager(enabled=True))
-        env = Path("C:/venv")
-        path = installer._pip_path(env)
-        if os.name == "nt":
-            assert "Scripts" in path
-        else:
-            assert "bin" in path
+        path = installer._pip_path(Path("C:/venv"))
+        assert scripts_dir in path
         assert "pip" in path
+
+    def test_pip_path_is_computed_once_per_env(self, tmp_root: Path):
+        installer = PipInstaller(test_mode=TestModeManager(enabled=True), env_path=tmp_root)
+        assert installer._pip_path(tmp_root) is installer._pip_path(tmp_root)
+        assert list(installer._pip_paths) == [tmp_root]